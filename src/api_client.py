@@ -58,26 +58,71 @@ class WorkflowState(Enum):
 
 
 # 失败状态集合
-FAILURE_STATES = {
+FAILURE_STATES = frozenset({
     TaskState.FAILURE.value,
     TaskState.KILL.value,
     TaskState.NEED_FAULT_TOLERANCE.value
-}
+})
 
 # 运行中状态集合
-RUNNING_STATES = {
+RUNNING_STATES = frozenset({
     TaskState.RUNNING_EXECUTION.value,
     TaskState.SUBMITTED_SUCCESS.value,
     TaskState.DELAY_EXECUTION.value,
     TaskState.DISPATCH.value,
     TaskState.WAITING_THREAD.value,
     TaskState.WAITING_DEPEND.value
-}
+})
 
 # 成功状态集合
-SUCCESS_STATES = {
+SUCCESS_STATES = frozenset({
     TaskState.SUCCESS.value,
     TaskState.FORCED_SUCCESS.value
+})
+
+# 工作流运行中状态集合
+WORKFLOW_RUNNING_STATES = frozenset({
+    WorkflowState.RUNNING_EXECUTION.value,
+    WorkflowState.SUBMITTED_SUCCESS.value
+})
+
+# 状态名称 -> 状态值（WorkflowState 的名称和值与 TaskState 一致）
+_STATE_VALUE_BY_NAME = {state.name: state.value for state in TaskState}
+
+
+def _normalize_state(state: Any) -> Optional[int]:
+    """
+    将 API 返回的状态统一为整数状态值
+
+    支持整数、字符串（不区分大小写）和枚举三种格式。
+
+    Args:
+        state: 原始状态
+
+    Returns:
+        状态值，无法识别时为 None
+    """
+    if isinstance(state, str):
+        return _STATE_VALUE_BY_NAME.get(state.upper())
+    if isinstance(state, Enum):
+        return state.value
+    return state
+
+
+_WORKFLOW_FAILURE = WorkflowState.FAILURE.value
+_WORKFLOW_SUCCESS = WorkflowState.SUCCESS.value
+
+# 任务状态分类
+_KIND_UNKNOWN = 0
+_KIND_RUNNING = 1
+_KIND_FAILED = 2
+_KIND_SUCCESS = 3
+
+# 状态值（经 _normalize_state 统一后）-> 状态分类
+_STATE_KIND: Dict[int, int] = {
+    **{value: _KIND_FAILED for value in FAILURE_STATES},
+    **{value: _KIND_RUNNING for value in RUNNING_STATES},
+    **{value: _KIND_SUCCESS for value in SUCCESS_STATES},
 }
 
 
@@ -94,32 +139,29 @@ class TaskInstance:
     start_time: Optional[str] = None
     end_time: Optional[str] = None
 
+    def _classify(self) -> int:
+        """
+        按当前状态计算状态分类（每次读取 state，赋值后不会过期）
+
+        Returns:
+            _KIND_RUNNING / _KIND_FAILED / _KIND_SUCCESS / _KIND_UNKNOWN
+        """
+        return _STATE_KIND.get(_normalize_state(self.state), _KIND_UNKNOWN)
+
     @property
     def is_failed(self) -> bool:
         """是否失败"""
-        # 支持字符串和整数两种格式
-        if isinstance(self.state, str):
-            return self.state.upper() in {'FAILURE', 'KILL', 'NEED_FAULT_TOLERANCE'}
-        return self.state in FAILURE_STATES
+        return self._classify() == _KIND_FAILED
 
     @property
     def is_running(self) -> bool:
         """是否运行中"""
-        # 支持字符串和整数两种格式
-        if isinstance(self.state, str):
-            return self.state.upper() in {
-                'RUNNING_EXECUTION', 'SUBMITTED_SUCCESS', 'DELAY_EXECUTION',
-                'DISPATCH', 'WAITING_THREAD', 'WAITING_DEPEND'
-            }
-        return self.state in RUNNING_STATES
+        return self._classify() == _KIND_RUNNING
 
     @property
     def is_success(self) -> bool:
         """是否成功"""
-        # 支持字符串和整数两种格式
-        if isinstance(self.state, str):
-            return self.state.upper() in {'SUCCESS', 'FORCED_SUCCESS'}
-        return self.state in SUCCESS_STATES
+        return self._classify() == _KIND_SUCCESS
 
     @property
     def retry_exhausted(self) -> bool:
@@ -129,7 +171,7 @@ class TaskInstance:
     @property
     def is_sub_process(self) -> bool:
         """是否是子工作流（嵌套工作流）"""
-        return self.task_type.upper() == 'SUB_PROCESS'
+        return (self.task_type or '').upper() == 'SUB_PROCESS'
 
 
 @dataclass
@@ -149,29 +191,17 @@ class WorkflowInstance:
     @property
     def is_failed(self) -> bool:
         """是否失败"""
-        # 支持字符串和整数两种格式
-        if isinstance(self.state, str):
-            return self.state.upper() == 'FAILURE'
-        return self.state == WorkflowState.FAILURE.value
+        return _normalize_state(self.state) == _WORKFLOW_FAILURE
 
     @property
     def is_running(self) -> bool:
         """是否运行中"""
-        # 支持字符串和整数两种格式
-        if isinstance(self.state, str):
-            return self.state.upper() in {'RUNNING_EXECUTION', 'SUBMITTED_SUCCESS'}
-        return self.state in {
-            WorkflowState.RUNNING_EXECUTION.value,
-            WorkflowState.SUBMITTED_SUCCESS.value
-        }
+        return _normalize_state(self.state) in WORKFLOW_RUNNING_STATES
 
     @property
     def is_success(self) -> bool:
         """是否成功"""
-        # 支持字符串和整数两种格式
-        if isinstance(self.state, str):
-            return self.state.upper() == 'SUCCESS'
-        return self.state == WorkflowState.SUCCESS.value
+        return _normalize_state(self.state) == _WORKFLOW_SUCCESS
 
 
 @dataclass
@@ -584,7 +614,7 @@ class DolphinSchedulerClient:
         # 旧版本返回格式: data.totalList
         records = result['data'].get('taskList', result['data'].get('totalList', []))
 
-        if not records:
+        if not records and self.logger.is_debug_enabled():
             self.logger.debug(
                 f"工作流实例 {process_instance_id} 没有任务记录 "
                 f"(状态: {result['data'].get('processInstanceState', 'unknown')})"
@@ -40,6 +40,7 @@ class RetryConfig:
     max_recovery_attempts: int = 3
     recovery_interval: int = 30
     auto_recovery: bool = True
+    recovery_concurrency: int = 4  # recovery_interval 为 0 时，不同工作流并发恢复的最大数量
 
 
 @dataclass
@@ -194,7 +195,8 @@ class Config:
         return RetryConfig(
             max_recovery_attempts=int(max_recovery) if max_recovery else retry_config.get('max_recovery_attempts', 3),
             recovery_interval=retry_config.get('recovery_interval', 30),
-            auto_recovery=auto_recovery.lower() == 'true' if auto_recovery else retry_config.get('auto_recovery', True)
+            auto_recovery=auto_recovery.lower() == 'true' if auto_recovery else retry_config.get('auto_recovery', True),
+            recovery_concurrency=retry_config.get('recovery_concurrency', 4)
         )
 
     def _parse_logging_config(self) -> LoggingConfig:
@@ -286,7 +288,8 @@ class Config:
             'retry': {
                 'max_recovery_attempts': self.retry.max_recovery_attempts,
                 'recovery_interval': self.retry.recovery_interval,
-                'auto_recovery': self.retry.auto_recovery
+                'auto_recovery': self.retry.auto_recovery,
+                'recovery_concurrency': self.retry.recovery_concurrency
             },
             'logging': {
                 'level': self.logging.level,
@@ -108,6 +108,10 @@ class Logger:
 
         self._initialized = True
 
+    def is_debug_enabled(self) -> bool:
+        """是否输出调试信息（调用方可据此跳过调试日志的字符串格式化）"""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def debug(self, message: str) -> None:
         """记录调试信息"""
         self.logger.debug(message)
@@ -4,20 +4,24 @@
 负责持续监控工作流状态，并触发恢复流程
 """
 
+import os
 import time
+import select
 import signal
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Callable
+from collections import deque
+from typing import List, Dict, Optional, Callable, Tuple, Deque
 from threading import Event
+from concurrent.futures import ThreadPoolExecutor
 
-from .api_client import DolphinSchedulerClient, WorkflowInstance, ProcessDefinition
+from .api_client import DolphinSchedulerClient, WorkflowInstance, ProcessDefinition, WorkflowSchedule
 from .task_validator import TaskValidator
 from .recovery_handler import RecoveryHandler, RecoveryResult
 from .config import Config, ProjectConfig
 from .logger import get_logger
-from .notifiers import create_notification_manager, NotificationManager
+from .notifiers import create_notification_manager, NotificationManager, NotificationMessage
 from .notifiers.message_builder import (
     build_failure_detected_message,
     build_recovery_success_message,
@@ -40,7 +44,8 @@ class MonitorStats:
     skipped_due_to_schedule: int = 0   # 因调度状态跳过的 API 调用数量
     api_calls_saved: int = 0           # 节省的 API 调用次数
     last_check_time: Optional[str] = None
-    errors: List[str] = field(default_factory=list)
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=256))  # 只保留最近的错误信息
+    error_count: int = 0               # 累计错误次数
     # 24小时内失败工作流统计（按项目和工作流分组）
     workflow_failure_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)  # {project_name: {workflow_name: count}}
 
@@ -80,8 +85,9 @@ class WorkflowMonitor:
         self.config = config
         self.logger = get_logger()
 
-        # 初始化通知管理器
+        # 初始化通知管理器（是否有通知渠道只在配置变化时改变，缓存为布尔值）
         self.notification_manager = create_notification_manager(config.notification)
+        self._has_notifiers = self.notification_manager.has_notifiers()
 
         # 初始化通知限流器（24小时内最多6次）
         self.notification_rate_limiter = NotificationRateLimiter(
@@ -104,6 +110,9 @@ class WorkflowMonitor:
         self.monitored_projects: List[MonitoredProject] = []
         self._stop_event = Event()
         self._running = False
+        # 信号唤醒管道（signal.set_wakeup_fd），用于让等待立即响应停止信号
+        self._wakeup_r: Optional[int] = None
+        self._wakeup_w: Optional[int] = None
 
         # 回调函数
         self._on_failure_detected: Optional[Callable] = None
@@ -123,77 +132,126 @@ class WorkflowMonitor:
         project_map = {p.name: p for p in all_projects}
 
         success = True
+        found: List[MonitoredProject] = []
         for monitored in self.monitored_projects:
             project = project_map.get(monitored.config.name)
             if project:
                 monitored.project_code = project.code
                 monitored.status = "active"
                 self.logger.info(f"找到项目: {monitored.config.name} (code: {project.code})")
-
-                # 获取项目下的工作流定义
-                workflows = self.client.get_process_definitions(project.code)
-                workflow_map = {w.name: w.code for w in workflows}
-
-                # 根据配置确定需要查询调度的工作流
-                if not monitored.config.monitor_all and monitored.config.workflows:
-                    # 只查询配置的工作流的调度信息
-                    target_workflow_codes = [
-                        workflow_map[wf_name]
-                        for wf_name in monitored.config.workflows
-                        if wf_name in workflow_map
-                    ]
-                else:
-                    # monitor_all=true，查询所有工作流
-                    target_workflow_codes = None
-
-                # 获取工作流调度信息（用于智能调度监控）
-                schedule_map = {}
-                if self.enable_schedule_optimization:
-                    schedule_map = self.client.get_workflow_schedule_map(
-                        project.code, target_workflow_codes
-                    )
-                    self.logger.info(f"  获取到 {len(schedule_map)} 个工作流调度信息")
-
-                # 如果不是监控所有工作流，需要解析工作流编码
-                if not monitored.config.monitor_all and monitored.config.workflows:
-                    for wf_name in monitored.config.workflows:
-                        if wf_name in workflow_map:
-                            wf_code = workflow_map[wf_name]
-                            monitored.workflow_codes[wf_name] = wf_code
-                            self.logger.debug(f"  - 工作流: {wf_name} (code: {wf_code})")
-
-                            # 注册工作流调度信息
-                            if wf_code in schedule_map:
-                                schedule = schedule_map[wf_code]
-                                self.schedule_tracker.register_workflow(
-                                    project_code=project.code,
-                                    project_name=monitored.config.name,
-                                    workflow_code=wf_code,
-                                    workflow_name=wf_name,
-                                    cron_expression=schedule.crontab
-                                )
-                                self.logger.debug(f"    调度: {schedule.crontab}")
-                        else:
-                            self.logger.warning(f"  - 未找到工作流: {wf_name}")
-                else:
-                    # monitor_all=true 时，注册所有有调度的工作流
-                    for wf in workflows:
-                        if wf.code in schedule_map:
-                            schedule = schedule_map[wf.code]
-                            self.schedule_tracker.register_workflow(
-                                project_code=project.code,
-                                project_name=monitored.config.name,
-                                workflow_code=wf.code,
-                                workflow_name=wf.name,
-                                cron_expression=schedule.crontab
-                            )
+                found.append(monitored)
             else:
                 monitored.status = "not_found"
                 self.logger.warning(f"未找到项目: {monitored.config.name}")
                 success = False
 
+        if not found:
+            return success
+
+        # 并发获取各项目的工作流定义和调度信息，启动耗时从 O(K·RTT) 降为约 O(RTT)
+        with ThreadPoolExecutor(max_workers=min(8, len(found))) as executor:
+            metadata = list(executor.map(self._fetch_project_metadata, found))
+
+        # 注册调度信息只操作内存数据，顺序执行即可
+        for monitored, (workflows, schedule_map) in zip(found, metadata):
+            self._register_project_workflows(monitored, workflows, schedule_map)
+
         return success
 
+    def _fetch_project_metadata(
+        self,
+        monitored: MonitoredProject
+    ) -> Tuple[List[ProcessDefinition], Dict[int, WorkflowSchedule]]:
+        """
+        获取项目下的工作流定义及调度信息
+
+        Args:
+            monitored: 被监控的项目（project_code 已解析）
+
+        Returns:
+            (工作流定义列表, {工作流编码: 调度信息})
+        """
+        project_code = monitored.project_code
+
+        # 获取项目下的工作流定义
+        workflows = self.client.get_process_definitions(project_code)
+        workflow_map = {w.name: w.code for w in workflows}
+
+        # 根据配置确定需要查询调度的工作流
+        if not monitored.config.monitor_all and monitored.config.workflows:
+            # 只查询配置的工作流的调度信息
+            target_workflow_codes = [
+                workflow_map[wf_name]
+                for wf_name in monitored.config.workflows
+                if wf_name in workflow_map
+            ]
+        else:
+            # monitor_all=true，查询所有工作流
+            target_workflow_codes = None
+
+        # 获取工作流调度信息（用于智能调度监控）
+        schedule_map: Dict[int, WorkflowSchedule] = {}
+        if self.enable_schedule_optimization:
+            schedule_map = self.client.get_workflow_schedule_map(
+                project_code, target_workflow_codes
+            )
+            self.logger.info(
+                f"  项目 {monitored.config.name} 获取到 {len(schedule_map)} 个工作流调度信息"
+            )
+
+        return workflows, schedule_map
+
+    def _register_project_workflows(
+        self,
+        monitored: MonitoredProject,
+        workflows: List[ProcessDefinition],
+        schedule_map: Dict[int, WorkflowSchedule]
+    ) -> None:
+        """
+        解析工作流编码并注册调度信息
+
+        Args:
+            monitored: 被监控的项目
+            workflows: 项目下的工作流定义
+            schedule_map: {工作流编码: 调度信息}
+        """
+        project_code = monitored.project_code
+        workflow_map = {w.name: w.code for w in workflows}
+
+        # 如果不是监控所有工作流，需要解析工作流编码
+        if not monitored.config.monitor_all and monitored.config.workflows:
+            for wf_name in monitored.config.workflows:
+                if wf_name in workflow_map:
+                    wf_code = workflow_map[wf_name]
+                    monitored.workflow_codes[wf_name] = wf_code
+                    self.logger.debug(f"  - 工作流: {wf_name} (code: {wf_code})")
+
+                    # 注册工作流调度信息
+                    if wf_code in schedule_map:
+                        schedule = schedule_map[wf_code]
+                        self.schedule_tracker.register_workflow(
+                            project_code=project_code,
+                            project_name=monitored.config.name,
+                            workflow_code=wf_code,
+                            workflow_name=wf_name,
+                            cron_expression=schedule.crontab
+                        )
+                        self.logger.debug(f"    调度: {schedule.crontab}")
+                else:
+                    self.logger.warning(f"  - 未找到工作流: {wf_name}")
+        else:
+            # monitor_all=true 时，注册所有有调度的工作流
+            for wf in workflows:
+                if wf.code in schedule_map:
+                    schedule = schedule_map[wf.code]
+                    self.schedule_tracker.register_workflow(
+                        project_code=project_code,
+                        project_name=monitored.config.name,
+                        workflow_code=wf.code,
+                        workflow_name=wf.name,
+                        cron_expression=schedule.crontab
+                    )
+
     def set_callbacks(
         self,
         on_failure_detected: Optional[Callable] = None,
@@ -235,11 +293,19 @@ class WorkflowMonitor:
                 error_msg = f"检查项目 {monitored.config.name} 时出错: {str(e)}"
                 self.logger.error(error_msg)
                 self.stats.errors.append(error_msg)
+                self.stats.error_count += 1
+
+        # 单次遍历统计恢复尝试/成功次数
+        attempts = 0
+        successes = 0
+        for r in results:
+            attempts += r.recovery_executed
+            successes += r.recovery_success
 
         self.logger.info(
             f"检查完成 | 发现失败工作流: {len(results)} | "
-            f"尝试恢复: {sum(1 for r in results if r.recovery_executed)} | "
-            f"恢复成功: {sum(1 for r in results if r.recovery_success)}"
+            f"尝试恢复: {attempts} | "
+            f"恢复成功: {successes}"
         )
 
         return results
@@ -302,6 +368,8 @@ class WorkflowMonitor:
         """
         results: List[RecoveryResult] = []
         project_code = monitored.project_code
+        has_notifiers = self._has_notifiers
+        enable_schedule_optimization = self.enable_schedule_optimization
 
         self.logger.debug(f"检查项目: {monitored.config.name}")
 
@@ -329,19 +397,20 @@ class WorkflowMonitor:
             workflows_to_check = workflow_codes_list
             skipped_count = 0
 
-            if self.enable_schedule_optimization:
+            if enable_schedule_optimization:
                 # 获取监控决策
                 to_monitor, decisions = self.schedule_tracker.get_workflows_to_monitor(
                     project_code, workflow_codes_list
                 )
 
-                # 记录跳过的工作流
-                for decision in decisions:
-                    if not decision.should_query_api:
-                        skipped_count += 1
-                        self.logger.debug(
-                            f"  跳过工作流 [{decision.workflow_name}]: {decision.reason}"
-                        )
+                # 记录跳过的工作流（调试日志关闭时不格式化决策原因）
+                skipped_count = len(decisions) - len(to_monitor)
+                if skipped_count and self.logger.is_debug_enabled():
+                    for decision in decisions:
+                        if not decision.should_query_api:
+                            self.logger.debug(
+                                f"  跳过工作流 [{decision.workflow_name}]: {decision.reason}"
+                            )
 
                 workflows_to_check = to_monitor
                 self.stats.skipped_due_to_schedule += skipped_count
@@ -425,6 +494,12 @@ class WorkflowMonitor:
             # 按工作流定义编码分组
             workflow_groups[wf.process_definition_code].append(wf)
 
+        # 每个工作流定义只提取一次名称，供下面的统计和阈值判断复用
+        wf_name_by_code = {
+            def_code: self._extract_workflow_name(instances[0].name)
+            for def_code, instances in workflow_groups.items()
+        }
+
         # 输出统计信息并记录到全局统计
         project_name = monitored.config.name
         if project_name not in self.stats.workflow_failure_stats:
@@ -432,8 +507,7 @@ class WorkflowMonitor:
 
         self.logger.info(f"失败工作流统计（按工作流定义分组）:")
         for def_code, instances in workflow_groups.items():
-            # 提取工作流名称
-            wf_name = self._extract_workflow_name(instances[0].name) if instances else "未知"
+            wf_name = wf_name_by_code[def_code]
 
             self.logger.info(
                 f"  - [{wf_name}] (定义码:{def_code}): {len(instances)} 个失败实例"
@@ -457,70 +531,101 @@ class WorkflowMonitor:
         max_failures_threshold = self.config.monitor.max_failures_for_recovery
         workflows_to_recover = []
         workflows_to_notify_only = []
+        threshold_messages: List[NotificationMessage] = []
+        # 与 threshold_messages 一一对应的 (工作流定义码, 工作流名称)，发送成功后计入通知限额
+        threshold_workflows: List[Tuple[int, str]] = []
+
+        # 快速路径：没有任何工作流定义超过阈值时，全部尝试恢复，
+        # 跳过逐组的阈值判断和通知限流检查
+        any_exceed = any(
+            len(instances) > max_failures_threshold
+            for instances in workflow_groups.values()
+        )
 
-        for def_code, instances in workflow_groups.items():
-            # 提取工作流名称
-            wf_name = self._extract_workflow_name(instances[0].name) if instances else "未知"
-
-            # 判断该工作流定义的失败实例数量是否超过阈值
-            failure_count = len(instances)  # 该工作流定义的失败实例数量
+        if not any_exceed:
+            # 与逐组判断一致：按工作流定义分组的顺序恢复
+            for def_code, instances in workflow_groups.items():
+                workflows_to_recover.extend(instances)
+                if self.logger.is_debug_enabled():
+                    self.logger.debug(
+                        f"工作流 [{wf_name_by_code[def_code]}] 失败 {len(instances)} 个实例，"
+                        f"未超过阈值({max_failures_threshold})，将尝试恢复"
+                    )
+        else:
+            for def_code, instances in workflow_groups.items():
+                wf_name = wf_name_by_code[def_code]
+
+                # 判断该工作流定义的失败实例数量是否超过阈值
+                failure_count = len(instances)  # 该工作流定义的失败实例数量
+
+                if failure_count > max_failures_threshold:
+                    # 超过阈值：该工作流短时间内多次失败，只通知不恢复
+                    workflows_to_notify_only.extend(instances)
+                    self.stats.skipped_due_to_threshold += len(instances)
+                    self.logger.warning(
+                        f"⚠️  工作流 [{wf_name}] 在 {time_window_hours} 小时内有 {failure_count} 个实例失败，"
+                        f"超过阈值({max_failures_threshold}个)，只通知不恢复"
+                    )
 
-            if failure_count > max_failures_threshold:
-                # 超过阈值：该工作流短时间内多次失败，只通知不恢复
-                workflows_to_notify_only.extend(instances)
-                self.stats.skipped_due_to_threshold += len(instances)
-                self.logger.warning(
-                    f"⚠️  工作流 [{wf_name}] 在 {time_window_hours} 小时内有 {failure_count} 个实例失败，"
-                    f"超过阈值({max_failures_threshold}个)，只通知不恢复"
-                )
+                    # 发送超过阈值通知（带限流控制）
+                    if instances and has_notifiers:
+                        # 检查是否可以发送通知（24小时内最多6次）
+                        if self.notification_rate_limiter.can_notify(
+                            project_name=monitored.config.name,
+                            workflow_definition_code=def_code,
+                            workflow_name=wf_name
+                        ):
+                            message = build_threshold_exceeded_message(
+                                workflow=instances[0],
+                                project_name=monitored.config.name,
+                                failure_count=failure_count,
+                                threshold=max_failures_threshold,
+                                time_window=time_window_hours
+                            )
+                            # 本轮检查结束后与其他超过阈值通知一起批量发送
+                            threshold_messages.append(message)
+                            threshold_workflows.append((def_code, wf_name))
+                            self.logger.info(f"工作流 [{wf_name}] 的超过阈值通知已加入本轮发送队列")
+                        else:
+                            # 超过通知限制
+                            count = self.notification_rate_limiter.get_notification_count(
+                                project_name=monitored.config.name,
+                                workflow_definition_code=def_code
+                            )
+                            self.logger.warning(
+                                f"工作流 [{wf_name}] 在24小时内已发送 {count} 次通知，"
+                                f"达到上限(6次)，已跳过本次通知"
+                            )
+                else:
+                    # 未超过阈值：可以尝试自动恢复
+                    workflows_to_recover.extend(instances)
+                    self.logger.debug(
+                        f"工作流 [{wf_name}] 失败 {failure_count} 个实例，"
+                        f"未超过阈值({max_failures_threshold})，将尝试恢复"
+                    )
 
-                # 发送超过阈值通知（带限流控制）
-                if instances and self.notification_manager.has_notifiers():
-                    # 检查是否可以发送通知（24小时内最多6次）
-                    if self.notification_rate_limiter.can_notify(
+        # 批量发送本轮检查产生的超过阈值通知，至少一个渠道发送成功才计入通知限额
+        if threshold_messages:
+            send_results = self.notification_manager.send_batch(threshold_messages)
+            if any(send_results.values()):
+                for def_code, wf_name in threshold_workflows:
+                    # 记录本次通知
+                    self.notification_rate_limiter.record_notification(
                         project_name=monitored.config.name,
                         workflow_definition_code=def_code,
                         workflow_name=wf_name
-                    ):
-                        message = build_threshold_exceeded_message(
-                            workflow=instances[0],
-                            project_name=monitored.config.name,
-                            failure_count=failure_count,
-                            threshold=max_failures_threshold,
-                            time_window=time_window_hours
-                        )
-                        self.notification_manager.send(message)
-
-                        # 记录本次通知
-                        self.notification_rate_limiter.record_notification(
-                            project_name=monitored.config.name,
-                            workflow_definition_code=def_code,
-                            workflow_name=wf_name
-                        )
+                    )
 
-                        remaining = self.notification_rate_limiter.get_remaining_notifications(
-                            project_name=monitored.config.name,
-                            workflow_definition_code=def_code
-                        )
-                        self.logger.info(
-                            f"已发送超过阈值通知，24小时内还可发送 {remaining} 次通知"
-                        )
-                    else:
-                        # 超过通知限制
-                        count = self.notification_rate_limiter.get_notification_count(
-                            project_name=monitored.config.name,
-                            workflow_definition_code=def_code
-                        )
-                        self.logger.warning(
-                            f"工作流 [{wf_name}] 在24小时内已发送 {count} 次通知，"
-                            f"达到上限(6次)，已跳过本次通知"
-                        )
+                    remaining = self.notification_rate_limiter.get_remaining_notifications(
+                        project_name=monitored.config.name,
+                        workflow_definition_code=def_code
+                    )
+                    self.logger.info(
+                        f"已发送工作流 [{wf_name}] 的超过阈值通知，24小时内还可发送 {remaining} 次通知"
+                    )
             else:
-                # 未超过阈值：可以尝试自动恢复
-                workflows_to_recover.extend(instances)
-                self.logger.debug(
-                    f"工作流 [{wf_name}] 失败 {failure_count} 个实例，"
-                    f"未超过阈值({max_failures_threshold})，将尝试恢复"
+                self.logger.warning(
+                    f"{len(threshold_messages)} 条超过阈值通知发送失败，不计入通知限额"
                 )
 
         # 输出超过阈值的工作流详情
@@ -542,6 +647,21 @@ class WorkflowMonitor:
                 f"将尝试恢复 {len(workflows_to_recover)} 个工作流实例"
             )
 
+        # 无恢复间隔时，不同工作流定义之间的恢复互不依赖，可并发执行
+        recovery_concurrency = self.config.retry.recovery_concurrency
+        if (
+            self.config.retry.recovery_interval <= 0
+            and recovery_concurrency > 1
+            and len(workflows_to_recover) > 1
+        ):
+            results.extend(
+                self._recover_concurrently(
+                    monitored, workflows_to_recover, recovery_concurrency,
+                    has_notifiers, enable_schedule_optimization
+                )
+            )
+            return results
+
         for instance in workflows_to_recover:
             # 触发失败检测回调（保留旧的回调接口）
             if self._on_failure_detected:
@@ -553,58 +673,133 @@ class WorkflowMonitor:
                 instance
             )
             results.append(result)
+            self._handle_recovery_result(
+                monitored, instance, result, has_notifiers, enable_schedule_optimization
+            )
 
-            # 更新统计并发送通知
+            # 恢复操作之间的间隔
             if result.recovery_executed:
-                self.stats.recovery_attempts += 1
+                time.sleep(self.config.retry.recovery_interval)
 
-                if result.recovery_success:
-                    self.stats.successful_recoveries += 1
+        return results
 
-                    # 更新调度追踪器状态
-                    if self.enable_schedule_optimization:
-                        self.schedule_tracker.mark_recovered(
-                            project_code=project_code,
-                            workflow_code=instance.process_definition_code,
-                            instance_id=instance.id
-                        )
+    def _recover_concurrently(
+        self,
+        monitored: MonitoredProject,
+        instances: List[WorkflowInstance],
+        max_workers: int,
+        has_notifiers: bool,
+        enable_schedule_optimization: bool
+    ) -> List[RecoveryResult]:
+        """
+        并发恢复多个工作流实例
 
-                    # 发送恢复成功通知
-                    if self.notification_manager.has_notifiers():
-                        message = build_recovery_success_message(
-                            result=result,
-                            project_name=monitored.config.name
-                        )
-                        self.notification_manager.send(message)
-                        self.logger.debug(f"已发送恢复成功通知: {instance.name}")
-                else:
-                    # 更新调度追踪器状态（恢复失败，继续监控）
-                    if self.enable_schedule_optimization:
-                        self.schedule_tracker.mark_failed(
-                            project_code=project_code,
-                            workflow_code=instance.process_definition_code,
-                            instance_id=instance.id
-                        )
+        按工作流定义分组：同一定义的实例仍串行处理，不同定义之间并发执行。
+        统计更新和通知发送在调用线程中串行完成。
 
-                    # 发送恢复失败通知
-                    if self.notification_manager.has_notifiers():
-                        message = build_recovery_failed_message(
-                            result=result,
-                            project_name=monitored.config.name
-                        )
-                        self.notification_manager.send(message)
-                        self.logger.debug(f"已发送恢复失败通知: {instance.name}")
+        Args:
+            monitored: 被监控的项目
+            instances: 需要恢复的工作流实例
+            max_workers: 最大并发数
+            has_notifiers: 是否有已启用的通知器
+            enable_schedule_optimization: 是否启用调度感知优化
 
-                # 触发恢复执行回调
-                if self._on_recovery_executed:
-                    self._on_recovery_executed(result)
+        Returns:
+            恢复结果列表
+        """
+        project_code = monitored.project_code
 
-            # 恢复操作之间的间隔
-            if result.recovery_executed:
-                time.sleep(self.config.retry.recovery_interval)
+        groups: Dict[int, List[WorkflowInstance]] = {}
+        for instance in instances:
+            # 触发失败检测回调（保留旧的回调接口）
+            if self._on_failure_detected:
+                self._on_failure_detected(instance)
+            groups.setdefault(instance.process_definition_code, []).append(instance)
+
+        def recover_group(group: List[WorkflowInstance]) -> List[Tuple[WorkflowInstance, RecoveryResult]]:
+            return [
+                (instance, self.recovery_handler.process_failed_workflow(project_code, instance))
+                for instance in group
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            group_results = list(executor.map(recover_group, groups.values()))
+
+        results: List[RecoveryResult] = []
+        for group_result in group_results:
+            for instance, result in group_result:
+                results.append(result)
+                self._handle_recovery_result(
+                    monitored, instance, result, has_notifiers, enable_schedule_optimization
+                )
 
         return results
 
+    def _handle_recovery_result(
+        self,
+        monitored: MonitoredProject,
+        instance: WorkflowInstance,
+        result: RecoveryResult,
+        has_notifiers: bool,
+        enable_schedule_optimization: bool
+    ) -> None:
+        """
+        根据恢复结果更新统计、调度状态并发送通知
+
+        Args:
+            monitored: 被监控的项目
+            instance: 工作流实例
+            result: 恢复结果
+            has_notifiers: 是否有已启用的通知器
+            enable_schedule_optimization: 是否启用调度感知优化
+        """
+        if not result.recovery_executed:
+            return
+
+        project_code = monitored.project_code
+        self.stats.recovery_attempts += 1
+
+        if result.recovery_success:
+            self.stats.successful_recoveries += 1
+
+            # 更新调度追踪器状态
+            if enable_schedule_optimization:
+                self.schedule_tracker.mark_recovered(
+                    project_code=project_code,
+                    workflow_code=instance.process_definition_code,
+                    instance_id=instance.id
+                )
+
+            # 发送恢复成功通知
+            if has_notifiers:
+                message = build_recovery_success_message(
+                    result=result,
+                    project_name=monitored.config.name
+                )
+                self.notification_manager.send_batched(message)
+                self.logger.debug(f"已提交恢复成功通知: {instance.name}")
+        else:
+            # 更新调度追踪器状态（恢复失败，继续监控）
+            if enable_schedule_optimization:
+                self.schedule_tracker.mark_failed(
+                    project_code=project_code,
+                    workflow_code=instance.process_definition_code,
+                    instance_id=instance.id
+                )
+
+            # 发送恢复失败通知
+            if has_notifiers:
+                message = build_recovery_failed_message(
+                    result=result,
+                    project_name=monitored.config.name
+                )
+                self.notification_manager.send_batched(message)
+                self.logger.debug(f"已提交恢复失败通知: {instance.name}")
+
+        # 触发恢复执行回调
+        if self._on_recovery_executed:
+            self._on_recovery_executed(result)
+
     def run(self) -> None:
         """
         运行持续监控
@@ -649,7 +844,9 @@ class WorkflowMonitor:
             self.logger.info("收到中断信号，正在停止...")
         finally:
             self._running = False
+            self._close_wakeup_fd()
             self._print_summary()
+            self.notification_manager.close()
 
     def _run_continuous(self) -> None:
         """持续运行模式"""
@@ -659,7 +856,34 @@ class WorkflowMonitor:
             self.check_once()
 
             # 等待下一次检查
-            self._stop_event.wait(self.config.monitor.check_interval)
+            self._wait_for_next_check(self.config.monitor.check_interval)
+
+    def _wait_for_next_check(self, timeout: float) -> None:
+        """
+        等待下一次检查，收到停止信号时立即返回
+
+        Args:
+            timeout: 最长等待时间（秒）
+        """
+        if self._wakeup_r is None:
+            # 未能启用唤醒管道（如非主线程），回退到 Event 等待
+            self._stop_event.wait(timeout)
+            return
+
+        deadline = time.monotonic() + timeout
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            readable, _, _ = select.select([self._wakeup_r], [], [], remaining)
+            if readable:
+                # 清空管道，避免下次 select 立即返回
+                try:
+                    while os.read(self._wakeup_r, 512):
+                        pass
+                except (BlockingIOError, OSError):
+                    pass
 
     def _run_single(self) -> None:
         """单次运行模式"""
@@ -671,6 +895,13 @@ class WorkflowMonitor:
         self.logger.info("正在停止监控...")
         self._stop_event.set()
 
+        # 写入唤醒管道，让 select 等待立即返回
+        if self._wakeup_w is not None:
+            try:
+                os.write(self._wakeup_w, b'\0')
+            except OSError:
+                pass
+
     def _setup_signal_handlers(self) -> None:
         """设置信号处理器"""
         def signal_handler(signum, frame):
@@ -679,6 +910,43 @@ class WorkflowMonitor:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+        # 信号到达时由解释器向管道写入字节，select 等待可立即被唤醒
+        try:
+            r, w = os.pipe()
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+        except (OSError, AttributeError):
+            return
+
+        try:
+            signal.set_wakeup_fd(w)
+        except ValueError:
+            # 非主线程无法设置唤醒 fd
+            os.close(r)
+            os.close(w)
+            return
+
+        self._wakeup_r, self._wakeup_w = r, w
+
+    def _close_wakeup_fd(self) -> None:
+        """关闭信号唤醒管道"""
+        if self._wakeup_r is None:
+            return
+
+        try:
+            signal.set_wakeup_fd(-1)
+        except ValueError:
+            pass
+
+        for fd in (self._wakeup_r, self._wakeup_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+        self._wakeup_r = None
+        self._wakeup_w = None
+
     def _print_summary(self) -> None:
         """打印监控摘要"""
         self.logger.info("=" * 60)
@@ -712,9 +980,9 @@ class WorkflowMonitor:
                 for workflow_name, count in workflows.items():
                     self.logger.info(f"    - {workflow_name}: {count} 个失败实例")
 
-        if self.stats.errors:
+        if self.stats.error_count:
             self.logger.info("-" * 60)
-            self.logger.info(f"错误数量: {len(self.stats.errors)}")
+            self.logger.info(f"错误数量: {self.stats.error_count}")
 
         # 输出 API 调用统计
         self.logger.info("")
@@ -738,6 +1006,7 @@ class WorkflowMonitor:
                 'recovery_attempts': self.stats.recovery_attempts,
                 'successful_recoveries': self.stats.successful_recoveries,
                 'last_check_time': self.stats.last_check_time,
+                'error_count': self.stats.error_count,
                 'workflow_failure_stats': self.stats.workflow_failure_stats
             },
             'monitored_projects': [
@@ -4,11 +4,23 @@
 定义通知消息格式和通知器接口
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from threading import Condition, Lock, Timer
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
+
+
+# 通知时间格式
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _now_str() -> str:
+    """当前本地时间字符串（不创建 datetime 对象）"""
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime())
 
 
 class NotificationLevel(Enum):
@@ -30,11 +42,11 @@ class NotificationMessage:
     project_name: Optional[str] = None           # 项目名称
     start_time: Optional[str] = None             # 启动时间
     extra_fields: Dict[str, Any] = field(default_factory=dict)  # 额外字段
-    timestamp: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    timestamp: str = field(default_factory=_now_str)
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        return {
+        data = {
             'title': self.title,
             'level': self.level.value,
             'content': self.content,
@@ -43,8 +55,10 @@ class NotificationMessage:
             'project_name': self.project_name,
             'start_time': self.start_time,
             'timestamp': self.timestamp,
-            **self.extra_fields
         }
+        if self.extra_fields:
+            data.update(self.extra_fields)
+        return data
 
 
 class Notifier(ABC):
@@ -72,6 +86,21 @@ class Notifier(ABC):
         """
         pass
 
+    def send_batch(self, messages: List[NotificationMessage]) -> bool:
+        """
+        批量发送通知
+
+        默认逐条发送，支持合并发送的通知器可以覆盖此方法。
+
+        Args:
+            messages: 通知消息列表
+
+        Returns:
+            是否全部发送成功
+        """
+        results = [self.send(message) for message in messages]
+        return all(results)
+
     @abstractmethod
     def get_name(self) -> str:
         """获取通知器名称"""
@@ -81,13 +110,41 @@ class Notifier(ABC):
         """是否已启用"""
         return self.enabled
 
+    def close(self) -> None:
+        """释放通知器持有的资源（如连接），默认无操作"""
+        pass
+
 
 class NotificationManager:
     """通知管理器"""
 
-    def __init__(self):
-        """初始化通知管理器"""
+    def __init__(self, send_timeout: float = 60.0, batch_interval: float = 3.0):
+        """
+        初始化通知管理器
+
+        Args:
+            send_timeout: 一次发送等待各通知器完成的最长时间（秒）
+            batch_interval: send_batched 的合并窗口（秒）
+        """
         self.notifiers: List[Notifier] = []
+        self.send_timeout = send_timeout
+        self.batch_interval = batch_interval
+        # 各通知渠道并发发送使用的线程池（首次发送时按通知器数量创建）
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 监控线程和合并发送的定时器线程都会发送，线程池的创建、提交和关闭需加锁
+        self._executor_lock = Lock()
+
+        # 等待合并发送的消息
+        self._pending: Deque[NotificationMessage] = deque()
+        self._pending_lock = Lock()
+        self._batch_timer: Optional[Timer] = None
+        # 正在进行的合并发送数量，close() 等待其归零后再释放线程池和连接
+        self._flushes_in_flight = 0
+        self._flush_idle = Condition(self._pending_lock)
+
+        # close() 开始后不再接收合并消息；close() 完成后不再发送任何消息
+        self._closing = False
+        self._closed = False
 
     def add_notifier(self, notifier: Notifier) -> None:
         """
@@ -98,29 +155,167 @@ class NotificationManager:
         """
         if notifier.is_enabled():
             self.notifiers.append(notifier)
+            # 通知器数量变化，下次发送时按新数量重建线程池
+            self._shutdown_executor()
 
     def send(self, message: NotificationMessage) -> Dict[str, bool]:
         """
         发送通知到所有已启用的通知器
 
+        各通知渠道并发发送，总耗时取决于最慢的渠道而不是所有渠道之和。
+        没有通知器时直接返回空结果；调用方应先用 has_notifiers() 判断，
+        避免白白构建消息。
+
         Args:
             message: 通知消息
 
         Returns:
             各通知器的发送结果 {notifier_name: success}
         """
+        if not self.notifiers:
+            return {}
+
+        return self._fan_out(lambda notifier: notifier.send(message))
+
+    def send_batch(self, messages: List[NotificationMessage]) -> Dict[str, bool]:
+        """
+        批量发送多条通知到所有已启用的通知器
+
+        各通知器通过 send_batch 发送，支持合并的通知器（如企业微信）只发起少量请求。
+
+        Args:
+            messages: 通知消息列表
+
+        Returns:
+            各通知器的发送结果 {notifier_name: success}
+        """
+        if not self.notifiers or not messages:
+            return {}
+
+        return self._fan_out(lambda notifier: notifier.send_batch(messages))
+
+    def _fan_out(self, call: Callable[[Notifier], bool]) -> Dict[str, bool]:
+        """
+        在线程池中对所有通知器并发执行发送操作
+
+        Args:
+            call: 对单个通知器执行的发送操作
+
+        Returns:
+            各通知器的发送结果 {notifier_name: success}
+        """
+        with self._executor_lock:
+            if self._closed:
+                # 已关闭：线程池和连接均已释放，不再发送
+                return {notifier.get_name(): False for notifier in self.notifiers}
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.notifiers) or 1,
+                    thread_name_prefix="notifier"
+                )
+            futures = [
+                (notifier, self._executor.submit(call, notifier))
+                for notifier in self.notifiers
+            ]
+
+        # 所有渠道共用一个等待期限，最坏耗时为 send_timeout 而不是 N × send_timeout
+        wait([future for _, future in futures], timeout=self.send_timeout)
+
         results = {}
-        for notifier in self.notifiers:
+        for notifier, future in futures:
             try:
-                success = notifier.send(message)
-                results[notifier.get_name()] = success
-            except Exception as e:
+                # 超时未完成的渠道视为发送失败
+                results[notifier.get_name()] = future.done() and future.result()
+            except Exception:
                 # 通知失败不应该影响主流程
                 results[notifier.get_name()] = False
                 # 可以记录日志，但不抛出异常
 
         return results
 
+    def send_batched(self, message: NotificationMessage) -> None:
+        """
+        在合并窗口内缓存消息，窗口结束后统一发送
+
+        同一项目、同一级别的多条消息会合并为一条，避免失败集中爆发时
+        每条消息都单独请求各通知渠道。
+
+        Args:
+            message: 通知消息
+        """
+        if not self.notifiers:
+            return
+
+        with self._pending_lock:
+            if self._closing:
+                return
+            self._pending.append(message)
+            if self._batch_timer is None:
+                self._batch_timer = Timer(self.batch_interval, self._flush_batch)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+
+    def _flush_batch(self) -> None:
+        """发送合并窗口内缓存的消息"""
+        with self._pending_lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._batch_timer = None
+            self._flushes_in_flight += 1
+
+        try:
+            # 按 (项目, 级别) 分组，保持消息到达顺序
+            groups: Dict[Tuple[Optional[str], NotificationLevel], List[NotificationMessage]] = {}
+            for message in pending:
+                groups.setdefault((message.project_name, message.level), []).append(message)
+
+            for messages in groups.values():
+                if len(messages) == 1:
+                    self.send(messages[0])
+                else:
+                    self.send(self._merge_messages(messages))
+        finally:
+            with self._pending_lock:
+                self._flushes_in_flight -= 1
+                if self._flushes_in_flight == 0:
+                    self._flush_idle.notify_all()
+
+    @staticmethod
+    def _merge_messages(messages: List[NotificationMessage]) -> NotificationMessage:
+        """
+        将同一项目、同一级别的多条消息合并为一条
+
+        Args:
+            messages: 待合并的消息（至少一条）
+
+        Returns:
+            合并后的消息
+        """
+        first = messages[0]
+
+        # 逐条保留工作流 ID、启动时间和原始内容（如恢复失败原因）
+        content_lines = [f"合并窗口内共 {len(messages)} 条通知:"]
+        extra_fields: Dict[str, Any] = {}
+        for message in messages:
+            name = message.workflow_name or message.title
+            label = f"{name} ({message.workflow_id})" if message.workflow_id else name
+            content_lines.extend(["", f"**{label}**: {message.title}"])
+            if message.start_time:
+                content_lines.append(f"启动时间: {message.start_time}")
+            content_lines.append(message.content)
+            if message.extra_fields:
+                extra_fields[label] = ", ".join(
+                    f"{key}={value}" for key, value in message.extra_fields.items()
+                )
+
+        return NotificationMessage(
+            title=f"{first.title}（共 {len(messages)} 条）",
+            level=first.level,
+            content="\n".join(content_lines),
+            project_name=first.project_name,
+            extra_fields=extra_fields
+        )
+
     def has_notifiers(self) -> bool:
         """是否有已启用的通知器"""
         return len(self.notifiers) > 0
@@ -128,3 +323,32 @@ class NotificationManager:
     def get_notifiers_count(self) -> int:
         """获取通知器数量"""
         return len(self.notifiers)
+
+    def close(self) -> None:
+        """关闭通知管理器，发送尚未发出的合并消息并释放发送线程和各通知器持有的连接"""
+        with self._pending_lock:
+            self._closing = True
+            timer = self._batch_timer
+        if timer is not None:
+            timer.cancel()
+        # 发送剩余消息；定时器已触发时其发送可能仍在进行，等待全部完成
+        self._flush_batch()
+        with self._pending_lock:
+            while self._flushes_in_flight:
+                self._flush_idle.wait()
+
+        with self._executor_lock:
+            self._closed = True
+        self._shutdown_executor()
+        for notifier in self.notifiers:
+            try:
+                notifier.close()
+            except Exception:
+                pass
+
+    def _shutdown_executor(self) -> None:
+        """关闭线程池"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
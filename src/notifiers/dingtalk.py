@@ -4,6 +4,8 @@
 通过钉钉机器人 Webhook 发送通知
 """
 
+import atexit
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -11,6 +13,7 @@ import hmac
 import hashlib
 import base64
 import time
+from threading import Lock
 from urllib.parse import quote_plus
 from typing import Optional
 
@@ -21,7 +24,9 @@ from ..logger import get_logger
 def create_session_with_retry(
     retries: int = 3,
     backoff_factor: float = 0.5,
-    status_forcelist: tuple = (429, 500, 502, 503, 504)
+    status_forcelist: tuple = (429, 500, 502, 503, 504),
+    pool_connections: int = 10,
+    pool_maxsize: int = 20
 ) -> requests.Session:
     """
     创建带重试机制的 Session
@@ -30,6 +35,8 @@ def create_session_with_retry(
         retries: 最大重试次数
         backoff_factor: 重试间隔因子
         status_forcelist: 需要重试的状态码
+        pool_connections: 连接池数量（按主机）
+        pool_maxsize: 每个连接池的最大连接数
 
     Returns:
         配置好的 Session
@@ -41,30 +48,47 @@ def create_session_with_retry(
         status_forcelist=status_forcelist,
         allowed_methods=["POST"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
 
 
+# 所有钉钉通知器共享的 Session，复用到同一主机的 TCP/TLS 连接
+_SHARED_SESSION = create_session_with_retry(retries=3, backoff_factor=1.0)
+atexit.register(_SHARED_SESSION.close)
+
+
+# 级别对应的emoji
+_LEVEL_EMOJI = {
+    NotificationLevel.INFO: "ℹ️",
+    NotificationLevel.WARNING: "⚠️",
+    NotificationLevel.ERROR: "❌",
+    NotificationLevel.SUCCESS: "✅"
+}
+
+# 级别对应的颜色文字
+_LEVEL_TEXT = {
+    NotificationLevel.INFO: "信息",
+    NotificationLevel.WARNING: "警告",
+    NotificationLevel.ERROR: "错误",
+    NotificationLevel.SUCCESS: "成功"
+}
+
+
 class DingTalkNotifier(Notifier):
     """钉钉机器人通知器"""
 
     # 级别对应的emoji
-    LEVEL_EMOJI = {
-        NotificationLevel.INFO: "ℹ️",
-        NotificationLevel.WARNING: "⚠️",
-        NotificationLevel.ERROR: "❌",
-        NotificationLevel.SUCCESS: "✅"
-    }
+    LEVEL_EMOJI = _LEVEL_EMOJI
 
     # 级别对应的颜色文字
-    LEVEL_TEXT = {
-        NotificationLevel.INFO: "信息",
-        NotificationLevel.WARNING: "警告",
-        NotificationLevel.ERROR: "错误",
-        NotificationLevel.SUCCESS: "成功"
-    }
+    LEVEL_TEXT = _LEVEL_TEXT
 
     def __init__(
         self,
@@ -89,12 +113,18 @@ class DingTalkNotifier(Notifier):
         super().__init__(enabled)
         self.webhook_url = webhook_url
         self.secret = secret
+        # 密钥编码结果不会变化，只计算一次
+        self._secret_enc = secret.encode('utf-8') if secret else None
         self.keyword = keyword or ""
         self.at_mobiles = at_mobiles or []
         self.at_all = at_all
         self.logger = get_logger()
-        # 创建带重试机制的 Session
-        self.session = create_session_with_retry(retries=3, backoff_factor=1.0)
+        # 使用模块级共享的带重试机制的 Session
+        self.session = _SHARED_SESSION
+
+        # 最近一次构建的 (时间戳, URL)，同一毫秒内的并发发送直接复用
+        self._last_url_cache = (0, "")
+        self._url_lock = Lock()
 
     def get_name(self) -> str:
         """获取通知器名称"""
@@ -113,16 +143,9 @@ class DingTalkNotifier(Notifier):
         if not self.secret:
             return ""
 
-        secret_enc = self.secret.encode('utf-8')
-        string_to_sign = f'{timestamp}\n{self.secret}'
-        string_to_sign_enc = string_to_sign.encode('utf-8')
-        hmac_code = hmac.new(
-            secret_enc,
-            string_to_sign_enc,
-            digestmod=hashlib.sha256
-        ).digest()
-        sign = quote_plus(base64.b64encode(hmac_code))
-        return sign
+        string_to_sign = f'{timestamp}\n{self.secret}'.encode('utf-8')
+        hmac_code = hmac.new(self._secret_enc, string_to_sign, digestmod=hashlib.sha256).digest()
+        return quote_plus(base64.b64encode(hmac_code).decode('ascii'))
 
     def _build_url(self) -> str:
         """
@@ -131,14 +154,19 @@ class DingTalkNotifier(Notifier):
         Returns:
             完整的 Webhook URL
         """
-        url = self.webhook_url
+        if not self.secret:
+            return self.webhook_url
 
-        if self.secret:
-            timestamp = int(time.time() * 1000)
-            sign = self._generate_sign(timestamp)
-            url = f"{url}&timestamp={timestamp}&sign={sign}"
+        timestamp = int(time.time() * 1000)
+        with self._url_lock:
+            cached_timestamp, cached_url = self._last_url_cache
+            if timestamp == cached_timestamp:
+                return cached_url
 
-        return url
+            sign = self._generate_sign(timestamp)
+            url = f"{self.webhook_url}&timestamp={timestamp}&sign={sign}"
+            self._last_url_cache = (timestamp, url)
+            return url
 
     def _format_markdown_message(self, message: NotificationMessage) -> str:
         """
@@ -150,55 +178,31 @@ class DingTalkNotifier(Notifier):
         Returns:
             Markdown 格式的消息文本
         """
-        emoji = self.LEVEL_EMOJI.get(message.level, "📢")
-        level_text = self.LEVEL_TEXT.get(message.level, "通知")
+        emoji = _LEVEL_EMOJI.get(message.level, "📢")
+        level_text = _LEVEL_TEXT.get(message.level, "通知")
 
-        # 构建消息内容
-        lines = []
-
-        # 如果配置了关键词，添加到消息开头
-        if self.keyword:
-            lines.append(f"**{self.keyword}**")
-            lines.append("")
-
-        lines.extend([
-            f"## {emoji} {message.title}",
-            "",
+        # 一次性拼接所有行，未提供的可选字段为 None，由 filter 跳过
+        text = "\n".join(filter(None, (
+            f"## {emoji} {message.title}\n",
             f"**级别**: {level_text}",
             f"**时间**: {message.timestamp}",
-        ])
-
-        # 添加项目和工作流信息
-        if message.project_name:
-            lines.append(f"**项目**: {message.project_name}")
-
-        if message.workflow_name:
-            lines.append(f"**工作流**: {message.workflow_name}")
+            message.project_name and f"**项目**: {message.project_name}",
+            message.workflow_name and f"**工作流**: {message.workflow_name}",
+            message.workflow_id and f"**工作流ID**: {message.workflow_id}",
+            message.start_time and f"**启动时间**: {message.start_time}",
+            f"\n---\n\n{message.content}",
+        )))
 
-        if message.workflow_id:
-            lines.append(f"**工作流ID**: {message.workflow_id}")
-
-        if message.start_time:
-            lines.append(f"**启动时间**: {message.start_time}")
-
-        # 添加主要内容
-        lines.extend([
-            "",
-            "---",
-            "",
-            message.content
-        ])
+        # 如果配置了关键词，添加到消息开头
+        if self.keyword:
+            text = f"**{self.keyword}**\n\n{text}"
 
         # 添加额外字段
         if message.extra_fields:
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-            lines.append("**详细信息**:")
-            for key, value in message.extra_fields.items():
-                lines.append(f"- **{key}**: {value}")
-
-        return "\n".join(lines)
+            details = "".join(f"\n- **{key}**: {value}" for key, value in message.extra_fields.items())
+            text = f"{text}\n\n---\n\n**详细信息**:{details}"
+
+        return text
 
     def send(self, message: NotificationMessage) -> bool:
         """
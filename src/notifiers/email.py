@@ -5,6 +5,7 @@
 """
 
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
@@ -33,6 +34,52 @@ class EmailNotifier(Notifier):
         NotificationLevel.SUCCESS: "✅"
     }
 
+    # 表格行模板（{0}: 标签, {1}: 值）
+    _ROW_TEMPLATE = (
+        "<tr><td style='padding: 8px; border: 1px solid #ddd; font-weight: bold; "
+        "background-color: #f5f5f5;'>{0}</td>"
+        "<td style='padding: 8px; border: 1px solid #ddd;'>{1}</td></tr>"
+    )
+
+    # 额外信息表格模板（{0}: 表格行）
+    _EXTRA_TABLE_TEMPLATE = """
+            <h3 style="color: #333; margin-top: 20px;">详细信息</h3>
+            <table style="width: 100%; border-collapse: collapse; margin-top: 10px;">
+                {0}
+            </table>
+            """
+
+    # HTML 邮件模板，静态部分只在类定义时构建一次
+    _HTML_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        </head>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px;">
+            <div style="border-left: 4px solid {color}; padding-left: 20px; margin-bottom: 20px;">
+                <h1 style="color: {color}; margin: 0; font-size: 24px;">{emoji} {title}</h1>
+            </div>
+
+            <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
+                {info_table}
+            </table>
+
+            <div style="background-color: #f9f9f9; border: 1px solid #ddd; border-radius: 4px; padding: 15px; margin: 20px 0;">
+                <h3 style="color: #333; margin-top: 0;">消息内容</h3>
+                <p style="margin: 0; white-space: pre-wrap;">{content}</p>
+            </div>
+
+            {extra_table}
+
+            <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #999; font-size: 12px;">
+                <p>此邮件由 DolphinScheduler 工作流监控器自动发送，请勿回复。</p>
+            </div>
+        </body>
+        </html>
+        """
+
     def __init__(
         self,
         smtp_host: str,
@@ -67,10 +114,69 @@ class EmailNotifier(Notifier):
         self.use_ssl = use_ssl
         self.logger = get_logger()
 
+        # 发件人/收件人邮件头在通知器生命周期内不变，只编码一次
+        self._from_header = Header(f"DolphinScheduler 监控器 <{self.from_addr}>")
+        self._to_header = Header(", ".join(self.to_addrs))
+        self._to_addrs = tuple(self.to_addrs)
+
+        # 复用的 SMTP 连接（避免每封邮件都重新握手和登录）
+        self._server: Optional[smtplib.SMTP] = None
+        self._server_lock = threading.Lock()
+
     def get_name(self) -> str:
         """获取通知器名称"""
         return "Email"
 
+    def _connect(self) -> smtplib.SMTP:
+        """
+        建立新的 SMTP 连接并登录
+
+        Returns:
+            已登录的 SMTP 连接
+        """
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=10)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
+            server.starttls()
+
+        server.login(self.username, self.password)
+        return server
+
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        获取可用的 SMTP 连接（调用方需持有 _server_lock）
+
+        已有连接通过 NOOP 检查存活，失效时重新连接并登录。
+
+        Returns:
+            已登录的 SMTP 连接
+        """
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_server()
+
+        self._server = self._connect()
+        return self._server
+
+    def _drop_server(self) -> None:
+        """丢弃当前 SMTP 连接（调用方需持有 _server_lock）"""
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """关闭复用的 SMTP 连接"""
+        with self._server_lock:
+            self._drop_server()
+
     def _format_html_message(self, message: NotificationMessage) -> str:
         """
         格式化为 HTML 邮件
@@ -81,12 +187,7 @@ class EmailNotifier(Notifier):
         Returns:
             HTML 格式的邮件内容
         """
-        emoji = self.LEVEL_EMOJI.get(message.level, "📢")
-        color = self.LEVEL_COLOR.get(message.level, "#1890ff")
-
         # 构建基本信息表格
-        info_rows = []
-
         info_items = [
             ("级别", message.level.value),
             ("时间", message.timestamp),
@@ -104,64 +205,24 @@ class EmailNotifier(Notifier):
         if message.start_time:
             info_items.append(("启动时间", message.start_time))
 
-        for label, value in info_items:
-            info_rows.append(
-                f"<tr><td style='padding: 8px; border: 1px solid #ddd; font-weight: bold; "
-                f"background-color: #f5f5f5;'>{label}</td>"
-                f"<td style='padding: 8px; border: 1px solid #ddd;'>{value}</td></tr>"
-            )
-
-        info_table = "\n".join(info_rows)
+        row = self._ROW_TEMPLATE.format
+        info_table = "\n".join(row(label, value) for label, value in info_items)
 
         # 构建额外信息表格
         extra_table = ""
         if message.extra_fields:
-            extra_rows = []
-            for key, value in message.extra_fields.items():
-                extra_rows.append(
-                    f"<tr><td style='padding: 8px; border: 1px solid #ddd; font-weight: bold; "
-                    f"background-color: #f5f5f5;'>{key}</td>"
-                    f"<td style='padding: 8px; border: 1px solid #ddd;'>{value}</td></tr>"
-                )
-            extra_table = f"""
-            <h3 style="color: #333; margin-top: 20px;">详细信息</h3>
-            <table style="width: 100%; border-collapse: collapse; margin-top: 10px;">
-                {''.join(extra_rows)}
-            </table>
-            """
-
-        # HTML 模板
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px;">
-            <div style="border-left: 4px solid {color}; padding-left: 20px; margin-bottom: 20px;">
-                <h1 style="color: {color}; margin: 0; font-size: 24px;">{emoji} {message.title}</h1>
-            </div>
-
-            <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
-                {info_table}
-            </table>
-
-            <div style="background-color: #f9f9f9; border: 1px solid #ddd; border-radius: 4px; padding: 15px; margin: 20px 0;">
-                <h3 style="color: #333; margin-top: 0;">消息内容</h3>
-                <p style="margin: 0; white-space: pre-wrap;">{message.content}</p>
-            </div>
-
-            {extra_table}
-
-            <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #999; font-size: 12px;">
-                <p>此邮件由 DolphinScheduler 工作流监控器自动发送，请勿回复。</p>
-            </div>
-        </body>
-        </html>
-        """
+            extra_table = self._EXTRA_TABLE_TEMPLATE.format(
+                "".join(row(key, value) for key, value in message.extra_fields.items())
+            )
 
-        return html
+        return self._HTML_TEMPLATE.format_map({
+            'title': message.title,
+            'color': self.LEVEL_COLOR.get(message.level, "#1890ff"),
+            'emoji': self.LEVEL_EMOJI.get(message.level, "📢"),
+            'info_table': info_table,
+            'content': message.content,
+            'extra_table': extra_table,
+        })
 
     def send(self, message: NotificationMessage) -> bool:
         """
@@ -179,8 +240,8 @@ class EmailNotifier(Notifier):
         try:
             # 创建邮件对象
             msg = MIMEMultipart('alternative')
-            msg['From'] = Header(f"DolphinScheduler 监控器 <{self.from_addr}>")
-            msg['To'] = Header(", ".join(self.to_addrs))
+            msg['From'] = self._from_header
+            msg['To'] = self._to_header
             msg['Subject'] = Header(message.title, 'utf-8')
 
             # 添加 HTML 内容
@@ -188,16 +249,16 @@ class EmailNotifier(Notifier):
             html_part = MIMEText(html_content, 'html', 'utf-8')
             msg.attach(html_part)
 
-            # 连接 SMTP 服务器并发送
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=10)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
-                server.starttls()
+            # 在获取连接锁之前完成序列化，锁内只做网络发送
+            raw = msg.as_string()
 
-            server.login(self.username, self.password)
-            server.sendmail(self.from_addr, self.to_addrs, msg.as_string())
-            server.quit()
+            # 复用 SMTP 连接发送，连接异常时丢弃，下次发送重新连接
+            with self._server_lock:
+                try:
+                    self._get_server().sendmail(self.from_addr, self._to_addrs, raw)
+                except (smtplib.SMTPException, OSError):
+                    self._drop_server()
+                    raise
 
             self.logger.debug(f"邮件通知发送成功: {message.title}")
             return True
@@ -13,6 +13,18 @@ if TYPE_CHECKING:
 from .base import NotificationMessage, NotificationLevel
 
 
+# 各类通知的固定标题
+_FAILURE_DETECTED_TITLE = "🔍 检测到工作流失败"
+_RECOVERY_SUCCESS_TITLE = "✅ 工作流恢复成功"
+_RECOVERY_FAILED_TITLE = "❌ 工作流恢复失败"
+_THRESHOLD_EXCEEDED_TITLE = "⚠️ 工作流失败次数超过阈值"
+
+# 固定的消息内容
+_FAILURE_DETECTED_FOOTER = "请关注并检查工作流状态。"
+_RECOVERY_SUCCESS_CONTENT = "工作流已成功从失败节点恢复，正在重新执行。"
+_RECOVERY_FAILED_CONTENT = "尝试恢复工作流失败，请人工介入处理。\n"
+
+
 def build_failure_detected_message(
     workflow: 'WorkflowInstance',
     project_name: str,
@@ -29,25 +41,16 @@ def build_failure_detected_message(
     Returns:
         通知消息
     """
-    title = f"🔍 检测到工作流失败"
-
-    content_lines = [
-        f"在项目 **{project_name}** 中检测到工作流失败。",
-        "",
-        "请关注并检查工作流状态。"
-    ]
-
+    header = f"在项目 **{project_name}** 中检测到工作流失败。"
     if reason:
-        content_lines.insert(1, f"原因: {reason}")
+        content = f"{header}\n原因: {reason}\n\n{_FAILURE_DETECTED_FOOTER}"
+    else:
+        content = f"{header}\n\n{_FAILURE_DETECTED_FOOTER}"
 
-    content = "\n".join(content_lines)
-
-    extra_fields = {}
-    if workflow.run_times:
-        extra_fields["运行次数"] = workflow.run_times
+    extra_fields = {"运行次数": workflow.run_times} if workflow.run_times else {}
 
     return NotificationMessage(
-        title=title,
+        title=_FAILURE_DETECTED_TITLE,
         level=NotificationLevel.WARNING,
         content=content,
         workflow_name=workflow.name,
@@ -73,24 +76,19 @@ def build_recovery_success_message(
         通知消息
     """
     workflow = result.workflow_instance
-    title = f"✅ 工作流恢复成功"
-
-    content = f"工作流已成功从失败节点恢复，正在重新执行。"
-
-    extra_fields = {
-        "恢复尝试次数": result.attempt_count,
-        "工作流运行次数": workflow.run_times
-    }
 
     return NotificationMessage(
-        title=title,
+        title=_RECOVERY_SUCCESS_TITLE,
         level=NotificationLevel.SUCCESS,
-        content=content,
+        content=_RECOVERY_SUCCESS_CONTENT,
         workflow_name=workflow.name,
         workflow_id=workflow.id,
         project_name=project_name,
         start_time=workflow.start_time,
-        extra_fields=extra_fields
+        extra_fields={
+            "恢复尝试次数": result.attempt_count,
+            "工作流运行次数": workflow.run_times
+        }
     )
 
 
@@ -109,17 +107,10 @@ def build_recovery_failed_message(
         通知消息
     """
     workflow = result.workflow_instance
-    title = f"❌ 工作流恢复失败"
-
-    content_lines = [
-        f"尝试恢复工作流失败，请人工介入处理。",
-        ""
-    ]
 
-    if result.skip_reason:
-        content_lines.append(f"**跳过原因**: {result.skip_reason}")
-
-    content = "\n".join(content_lines)
+    content = _RECOVERY_FAILED_CONTENT
+    if result.message:
+        content = f"{content}\n**原因**: {result.message}"
 
     extra_fields = {
         "恢复尝试次数": result.attempt_count,
@@ -130,7 +121,7 @@ def build_recovery_failed_message(
         extra_fields["验证结果"] = result.validation_result.message
 
     return NotificationMessage(
-        title=title,
+        title=_RECOVERY_FAILED_TITLE,
         level=NotificationLevel.ERROR,
         content=content,
         workflow_name=workflow.name,
@@ -161,8 +152,6 @@ def build_threshold_exceeded_message(
     Returns:
         通知消息
     """
-    title = f"⚠️ 工作流失败次数超过阈值"
-
     content = (
         f"工作流在 **{time_window}** 小时内失败了 **{failure_count}** 次，"
         f"超过阈值（{threshold}个）。\n\n"
@@ -177,7 +166,7 @@ def build_threshold_exceeded_message(
     }
 
     return NotificationMessage(
-        title=title,
+        title=_THRESHOLD_EXCEEDED_TITLE,
         level=NotificationLevel.WARNING,
         content=content,
         workflow_name=workflow.name,
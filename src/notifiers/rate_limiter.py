@@ -4,12 +4,17 @@
 防止短时间内对同一个工作流发送过多通知
 """
 
+import atexit
 import json
-from datetime import datetime, timedelta
+import os
+import time
+from bisect import bisect_right, insort
+from contextlib import suppress
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass, field, asdict
-from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from threading import Lock, Timer
 
 
 @dataclass
@@ -18,15 +23,36 @@ class NotificationRecord:
     workflow_definition_code: int
     workflow_name: str
     project_name: str
-    notification_times: List[str] = field(default_factory=list)  # ISO格式时间戳列表
+    notification_times: List[float] = field(default_factory=list)  # Unix 时间戳列表（升序）
 
     def clean_expired(self, time_window_hours: int = 24) -> None:
         """清理过期的通知记录"""
-        cutoff_time = datetime.now() - timedelta(hours=time_window_hours)
-        self.notification_times = [
-            t for t in self.notification_times
-            if datetime.fromisoformat(t) > cutoff_time
-        ]
+        self.prune_before(time.time() - time_window_hours * 3600)
+
+    def prune_before(self, cutoff: float) -> int:
+        """
+        删除不晚于 cutoff 的通知时间
+
+        Args:
+            cutoff: 过期边界（Unix 时间戳）
+
+        Returns:
+            删除的通知次数
+        """
+        times = self.notification_times
+        if not times or times[0] > cutoff:
+            return 0
+
+        # 最新一次通知也已过期，整体清空
+        if times[-1] <= cutoff:
+            removed = len(times)
+            times.clear()
+            return removed
+
+        # 时间戳有序，二分定位过期边界后整体删除
+        idx = bisect_right(times, cutoff)
+        del times[:idx]
+        return idx
 
     def can_notify(self, max_notifications: int, time_window_hours: int = 24) -> bool:
         """
@@ -44,13 +70,49 @@ class NotificationRecord:
 
     def add_notification(self) -> None:
         """记录一次通知"""
-        self.notification_times.append(datetime.now().isoformat())
+        insort(self.notification_times, time.time())
 
     def get_notification_count(self, time_window_hours: int = 24) -> int:
         """获取时间窗口内的通知次数"""
         self.clean_expired(time_window_hours)
         return len(self.notification_times)
 
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        转换为可序列化的字典
+
+        与 dataclasses.asdict 不同，不会深拷贝通知时间列表
+
+        Returns:
+            记录字典
+        """
+        return {
+            'workflow_definition_code': self.workflow_definition_code,
+            'workflow_name': self.workflow_name,
+            'project_name': self.project_name,
+            'notification_times': self.notification_times,
+        }
+
+
+def _parse_legacy_times(values: List[str]) -> List[float]:
+    """
+    将旧版本状态文件中的 ISO 格式时间字符串批量转换为有序的 Unix 时间戳
+
+    无法解析的时间会被跳过
+
+    Args:
+        values: ISO 格式时间字符串列表
+
+    Returns:
+        升序的 Unix 时间戳列表
+    """
+    timestamps = []
+    for value in values:
+        with suppress(ValueError, TypeError):
+            timestamps.append(datetime.fromisoformat(value).timestamp())
+    timestamps.sort()
+    return timestamps
+
 
 class NotificationRateLimiter:
     """通知限流器"""
@@ -59,7 +121,8 @@ class NotificationRateLimiter:
         self,
         state_file: str = "logs/notification_rate_limit.json",
         time_window_hours: int = 24,
-        max_notifications: int = 6
+        max_notifications: int = 6,
+        flush_interval: float = 2.0
     ):
         """
         初始化限流器
@@ -68,15 +131,31 @@ class NotificationRateLimiter:
             state_file: 状态文件路径
             time_window_hours: 时间窗口（小时）
             max_notifications: 时间窗口内最大通知次数
+            flush_interval: 状态写盘的最小间隔（秒），间隔内的多次变更合并为一次写入
         """
         self.state_file = Path(state_file)
         self.time_window_hours = time_window_hours
         self.max_notifications = max_notifications
+        self.flush_interval = flush_interval
         self.records: Dict[str, NotificationRecord] = {}
         self._lock = Lock()
-
-        # 加载历史记录
+        # 串行化写盘（写盘在 _lock 之外进行）
+        self._write_lock = Lock()
+
+        # 延迟写盘状态
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_timer: Optional[Timer] = None
+        # 快照序号：保证较旧的快照不会覆盖较新的快照
+        self._snapshot_seq = 0
+        self._written_seq = 0
+
+        # 加载历史记录（旧格式状态文件会立即以新格式重写）
         self._load_state()
+        self.flush()
+
+        # 进程退出前写入未保存的变更
+        atexit.register(self.flush)
 
     def _get_key(self, project_name: str, workflow_definition_code: int) -> str:
         """生成记录键"""
@@ -87,26 +166,93 @@ class NotificationRateLimiter:
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for key, record_data in data.items():
-                        self.records[key] = NotificationRecord(**record_data)
+                    data = json.loads(f.read())
+
+                records = {key: NotificationRecord(**record_data) for key, record_data in data.items()}
+
+                # 旧版本以 ISO 字符串保存时间：一次性批量转换，并标记为待写盘以新格式保存
+                first_times = next(
+                    (r.notification_times for r in records.values() if r.notification_times), None
+                )
+                if first_times is not None and isinstance(first_times[0], str):
+                    for record in records.values():
+                        record.notification_times = _parse_legacy_times(record.notification_times)
+                    self._dirty = True
+
+                self.records = records
             except Exception:
                 # 如果加载失败，从空状态开始
                 self.records = {}
 
-    def _save_state(self) -> None:
-        """保存状态到文件"""
-        try:
-            # 确保目录存在
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+    def _take_snapshot(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        """
+        复制当前状态用于写盘（调用方需持有锁）
+
+        Returns:
+            (快照序号, 状态数据)
+        """
+        data = {}
+        for key, record in self.records.items():
+            record_data = record.as_dict()
+            record_data['notification_times'] = record.notification_times[:]
+            data[key] = record_data
+
+        self._snapshot_seq += 1
+        self._dirty = False
+        self._last_flush = time.time()
+        return self._snapshot_seq, data
+
+    def _write_snapshot(self, seq: int, data: Dict[str, Dict[str, Any]]) -> None:
+        """
+        将状态快照写入文件（调用方不应持有 _lock）
+
+        Args:
+            seq: 快照序号
+            data: 状态数据
+        """
+        with self._write_lock:
+            # 已有更新的快照写入，跳过
+            if seq <= self._written_seq:
+                return
+
+            try:
+                # 确保目录存在
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # 先写临时文件再原子替换，避免写入中断导致状态文件损坏
+                tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+                # json.dumps 无缩进时走 C 编码器，一次写入整个文件
+                content = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_file, self.state_file)
+
+                self._written_seq = seq
+            except Exception:
+                # 保存失败不影响主流程，标记为待写盘并安排下次重试
+                with self._lock:
+                    self._dirty = True
+                    self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """在 flush_interval 之后写盘（调用方需持有锁）"""
+        if self._flush_timer is not None and self._flush_timer.is_alive():
+            return
+
+        self._flush_timer = Timer(self.flush_interval, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> None:
+        """立即写入未保存的变更"""
+        with self._lock:
+            # 先清除定时器引用：写盘期间记录的通知会重新安排一次写盘，而不会因定时器仍存活被漏掉
+            self._flush_timer = None
+            if not self._dirty:
+                return
+            snapshot = self._take_snapshot()
 
-            # 保存记录
-            data = {key: asdict(record) for key, record in self.records.items()}
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            # 保存失败不影响主流程
-            pass
+        self._write_snapshot(*snapshot)
 
     def can_notify(
         self,
@@ -149,6 +295,7 @@ class NotificationRateLimiter:
             workflow_definition_code: 工作流定义编码
             workflow_name: 工作流名称（可选）
         """
+        snapshot = None
         with self._lock:
             key = self._get_key(project_name, workflow_definition_code)
 
@@ -162,9 +309,17 @@ class NotificationRateLimiter:
 
             # 记录通知
             self.records[key].add_notification()
+            self._dirty = True
 
-            # 保存状态
-            self._save_state()
+            # 保存状态：距上次写盘超过 flush_interval 时立即写入，否则合并到稍后的一次写入
+            if time.time() - self._last_flush >= self.flush_interval:
+                snapshot = self._take_snapshot()
+            else:
+                self._schedule_flush()
+
+        # 在锁外写盘，不阻塞其他线程的 can_notify / record_notification
+        if snapshot is not None:
+            self._write_snapshot(*snapshot)
 
     def get_notification_count(
         self,
@@ -214,22 +369,24 @@ class NotificationRateLimiter:
         Returns:
             清理的记录数
         """
+        snapshot = None
         with self._lock:
+            cutoff = time.time() - self.time_window_hours * 3600
             cleaned = 0
-            for record in self.records.values():
-                before_count = len(record.notification_times)
-                record.clean_expired(self.time_window_hours)
-                cleaned += before_count - len(record.notification_times)
+            empty_keys = []
+            for key, record in self.records.items():
+                cleaned += record.prune_before(cutoff)
+                if not record.notification_times:
+                    empty_keys.append(key)
 
             # 移除空记录
-            empty_keys = [
-                key for key, record in self.records.items()
-                if len(record.notification_times) == 0
-            ]
             for key in empty_keys:
                 del self.records[key]
 
             if cleaned > 0:
-                self._save_state()
+                snapshot = self._take_snapshot()
+
+        if snapshot is not None:
+            self._write_snapshot(*snapshot)
 
-            return cleaned
+        return cleaned
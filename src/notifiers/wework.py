@@ -4,19 +4,28 @@
 通过企业微信机器人 Webhook 发送通知
 """
 
+import atexit
+import queue
+import threading
+import time
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from .base import Notifier, NotificationMessage, NotificationLevel
 from ..logger import get_logger
 
+__all__ = ['WeWorkNotifier']
+
 
 def create_session_with_retry(
     retries: int = 3,
     backoff_factor: float = 0.5,
-    status_forcelist: tuple = (429, 500, 502, 503, 504)
+    status_forcelist: tuple = (429, 500, 502, 503, 504),
+    pool_connections: int = 10,
+    pool_maxsize: int = 20
 ) -> requests.Session:
     """
     创建带重试机制的 Session
@@ -25,6 +34,8 @@ def create_session_with_retry(
         retries: 最大重试次数
         backoff_factor: 重试间隔因子
         status_forcelist: 需要重试的状态码
+        pool_connections: 连接池数量（按主机）
+        pool_maxsize: 每个连接池的最大连接数
 
     Returns:
         配置好的 Session
@@ -36,30 +47,112 @@ def create_session_with_retry(
         status_forcelist=status_forcelist,
         allowed_methods=["POST"]
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
 
 
+# 所有企业微信通知器共享的 Session，复用到同一主机的 TCP/TLS 连接
+# （企业微信只有 qyapi.weixin.qq.com 一个主机，少量连接池即可）
+_SHARED_SESSION = create_session_with_retry(
+    retries=3,
+    backoff_factor=1.0,
+    pool_connections=4,
+    pool_maxsize=16
+)
+atexit.register(_SHARED_SESSION.close)
+
+
+# 级别对应的颜色
+_LEVEL_COLOR = {
+    NotificationLevel.INFO: "info",
+    NotificationLevel.WARNING: "warning",
+    NotificationLevel.ERROR: "warning",  # 企业微信没有error样式，用warning
+    NotificationLevel.SUCCESS: "info"
+}
+
+# 级别对应的emoji
+_LEVEL_EMOJI = {
+    NotificationLevel.INFO: "ℹ️",
+    NotificationLevel.WARNING: "⚠️",
+    NotificationLevel.ERROR: "❌",
+    NotificationLevel.SUCCESS: "✅"
+}
+
+
+# 企业微信 markdown 消息内容的最大长度（UTF-8 字节）
+_MAX_CONTENT_BYTES = 4096
+
+# 批量发送时消息之间的分隔
+_BATCH_SEPARATOR = "\n\n---\n\n"
+
+# 后台发送队列：send() 只负责渲染和入队，由守护线程调用 _post() 实际发送
+# 队列元素为 (通知器, markdown 内容, 日志中使用的标题)
+_QUEUE: 'queue.Queue[Tuple[WeWorkNotifier, str, str]]' = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _worker_loop() -> None:
+    """后台发送线程：依次取出队列中的消息并同步发送"""
+    while True:
+        notifier, content, title = _QUEUE.get()
+        try:
+            notifier._post(content, title)
+        finally:
+            _QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    """确保后台发送线程已启动（首次发送时启动）"""
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_worker_loop, name="wework-sender", daemon=True)
+            _worker.start()
+
+
+def _wait_for_queue(timeout: float = 30.0) -> bool:
+    """
+    等待队列中的消息全部发送完成
+
+    Args:
+        timeout: 最长等待时间（秒）
+
+    Returns:
+        是否在超时前全部发送完成
+    """
+    deadline = time.monotonic() + timeout
+    with _QUEUE.all_tasks_done:
+        while _QUEUE.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _QUEUE.all_tasks_done.wait(remaining)
+    return True
+
+
+# 进程退出前尽量发送完队列中的消息（先于 Session 关闭执行）
+atexit.register(_wait_for_queue, 10.0)
+
+
 class WeWorkNotifier(Notifier):
     """企业微信机器人通知器"""
 
     # 级别对应的颜色
-    LEVEL_COLOR = {
-        NotificationLevel.INFO: "info",
-        NotificationLevel.WARNING: "warning",
-        NotificationLevel.ERROR: "warning",  # 企业微信没有error样式，用warning
-        NotificationLevel.SUCCESS: "info"
-    }
+    LEVEL_COLOR = _LEVEL_COLOR
 
     # 级别对应的emoji
-    LEVEL_EMOJI = {
-        NotificationLevel.INFO: "ℹ️",
-        NotificationLevel.WARNING: "⚠️",
-        NotificationLevel.ERROR: "❌",
-        NotificationLevel.SUCCESS: "✅"
-    }
+    LEVEL_EMOJI = _LEVEL_EMOJI
 
     def __init__(
         self,
@@ -82,8 +175,8 @@ class WeWorkNotifier(Notifier):
         self.mentioned_list = mentioned_list or []
         self.mentioned_mobile_list = mentioned_mobile_list or []
         self.logger = get_logger()
-        # 创建带重试机制的 Session
-        self.session = create_session_with_retry(retries=3, backoff_factor=1.0)
+        # 使用模块级共享的带重试机制的 Session
+        self.session = _SHARED_SESSION
 
     def get_name(self) -> str:
         """获取通知器名称"""
@@ -99,47 +192,89 @@ class WeWorkNotifier(Notifier):
         Returns:
             Markdown 格式的消息文本
         """
-        emoji = self.LEVEL_EMOJI.get(message.level, "📢")
+        emoji = _LEVEL_EMOJI.get(message.level, "📢")
 
-        # 构建消息内容
-        lines = [
-            f"## {emoji} {message.title}",
-            "",
-            f"> 级别: <font color=\"comment\">{message.level.value}</font>",
-            f"> 时间: <font color=\"comment\">{message.timestamp}</font>",
-        ]
+        # 可选字段：未提供时为空字符串
+        project = f'> 项目: <font color="comment">{message.project_name}</font>\n' if message.project_name else ""
+        workflow = f'> 工作流: <font color="comment">{message.workflow_name}</font>\n' if message.workflow_name else ""
+        workflow_id = f'> 工作流ID: <font color="comment">{message.workflow_id}</font>\n' if message.workflow_id else ""
+        start_time = f'> 启动时间: <font color="comment">{message.start_time}</font>\n' if message.start_time else ""
 
-        # 添加项目和工作流信息
-        if message.project_name:
-            lines.append(f"> 项目: <font color=\"comment\">{message.project_name}</font>")
+        # 额外字段
+        extras = ""
+        if message.extra_fields:
+            extras = "\n\n**详细信息**:\n" + "\n".join(
+                f'> {key}: <font color="comment">{value}</font>'
+                for key, value in message.extra_fields.items()
+            )
 
-        if message.workflow_name:
-            lines.append(f"> 工作流: <font color=\"comment\">{message.workflow_name}</font>")
+        return (
+            f"## {emoji} {message.title}\n\n"
+            f'> 级别: <font color="comment">{message.level.value}</font>\n'
+            f'> 时间: <font color="comment">{message.timestamp}</font>\n'
+            f"{project}{workflow}{workflow_id}{start_time}"
+            f"\n{message.content}{extras}"
+        )
 
-        if message.workflow_id:
-            lines.append(f"> 工作流ID: <font color=\"comment\">{message.workflow_id}</font>")
+    def send(self, message: NotificationMessage) -> bool:
+        """
+        发送企业微信通知（异步）
 
-        if message.start_time:
-            lines.append(f"> 启动时间: <font color=\"comment\">{message.start_time}</font>")
+        消息放入后台发送队列后立即返回，实际发送结果记录在日志中。
 
-        # 添加主要内容
-        lines.extend([
-            "",
-            message.content
-        ])
+        Args:
+            message: 通知消息
 
-        # 添加额外字段
-        if message.extra_fields:
-            lines.append("")
-            lines.append("**详细信息**:")
-            for key, value in message.extra_fields.items():
-                lines.append(f"> {key}: <font color=\"comment\">{value}</font>")
+        Returns:
+            是否已加入发送队列
+        """
+        if not self.enabled:
+            return False
 
-        return "\n".join(lines)
+        _ensure_worker()
+        _QUEUE.put((self, self._format_markdown_message(message), message.title))
+        return True
 
-    def send(self, message: NotificationMessage) -> bool:
+    def send_batch(self, messages: List[NotificationMessage]) -> bool:
         """
-        发送企业微信通知
+        批量发送企业微信通知（异步）
+
+        多条消息合并为尽量少的请求，每个请求的内容不超过企业微信 4096 字节的限制。
+
+        Args:
+            messages: 通知消息列表
+
+        Returns:
+            是否已加入发送队列
+        """
+        if not self.enabled:
+            return False
+        if not messages:
+            return True
+
+        separator_size = len(_BATCH_SEPARATOR.encode('utf-8'))
+        chunks: List[List[str]] = []
+        chunk_size = 0
+        for message in messages:
+            text = self._format_markdown_message(message)
+            size = len(text.encode('utf-8'))
+            # 当前请求放不下时另起一个请求（单条超长消息单独发送）
+            if chunks and chunk_size + separator_size + size <= _MAX_CONTENT_BYTES:
+                chunks[-1].append(text)
+                chunk_size += separator_size + size
+            else:
+                chunks.append([text])
+                chunk_size = size
+
+        _ensure_worker()
+        for i, chunk in enumerate(chunks, 1):
+            title = f"批量通知 {i}/{len(chunks)}（{len(chunk)} 条）"
+            _QUEUE.put((self, _BATCH_SEPARATOR.join(chunk), title))
+        return True
+
+    def send_sync(self, message: NotificationMessage) -> bool:
+        """
+        同步发送企业微信通知
 
         Args:
             message: 通知消息
@@ -150,14 +285,25 @@ class WeWorkNotifier(Notifier):
         if not self.enabled:
             return False
 
-        try:
-            markdown_text = self._format_markdown_message(message)
+        return self._post(self._format_markdown_message(message), message.title)
+
+    def _post(self, content: str, title: str) -> bool:
+        """
+        发送一条 markdown 消息到企业微信机器人
 
+        Args:
+            content: markdown 内容
+            title: 消息标题（用于日志）
+
+        Returns:
+            是否发送成功
+        """
+        try:
             # 构建请求数据
             data = {
                 "msgtype": "markdown",
                 "markdown": {
-                    "content": markdown_text
+                    "content": content
                 }
             }
 
@@ -173,7 +319,7 @@ class WeWorkNotifier(Notifier):
             if response.status_code == 200:
                 result = response.json()
                 if result.get('errcode') == 0:
-                    self.logger.debug(f"企业微信通知发送成功: {message.title}")
+                    self.logger.debug(f"企业微信通知发送成功: {title}")
                     return True
                 else:
                     self.logger.error(
@@ -198,3 +344,8 @@ class WeWorkNotifier(Notifier):
         except Exception as e:
             self.logger.error(f"发送企业微信通知时出错: {str(e)}")
             return False
+
+    def close(self) -> None:
+        """等待后台队列中的消息发送完成"""
+        if not _wait_for_queue():
+            self.logger.warning("企业微信通知队列未能在超时前发送完成")
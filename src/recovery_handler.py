@@ -8,12 +8,15 @@
 4. 执行恢复操作
 """
 
+import atexit
 import json
+import os
 import time
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from threading import RLock, Timer
+from typing import Dict, List, Optional, Set, Union
 
 from .api_client import DolphinSchedulerClient, WorkflowInstance
 from .task_validator import TaskValidator, WorkflowValidationResult, ValidationResult
@@ -21,6 +24,13 @@ from .config import RetryConfig
 from .logger import get_logger
 
 
+# 恢复历史日志累计超过该条数时，重写一次完整状态文件并清空日志
+_HISTORY_COMPACT_THRESHOLD = 200
+
+# 状态写盘合并窗口（秒）
+_SAVE_DELAY = 1.0
+
+
 @dataclass
 class RecoveryRecord:
     """恢复记录"""
@@ -28,13 +38,13 @@ class RecoveryRecord:
     workflow_name: str
     project_code: int
     attempt_count: int = 0
-    last_attempt_time: Optional[str] = None
+    last_attempt_time: Optional[float] = None     # Unix 时间戳
     recovery_history: List[Dict] = field(default_factory=list)
 
     def add_attempt(self, success: bool, message: str) -> None:
         """添加恢复尝试记录"""
         self.attempt_count += 1
-        self.last_attempt_time = datetime.now().isoformat()
+        self.last_attempt_time = time.time()
         self.recovery_history.append({
             'attempt': self.attempt_count,
             'time': self.last_attempt_time,
@@ -43,9 +53,35 @@ class RecoveryRecord:
         })
 
 
+def _to_timestamp(value: Union[float, int, str, None]) -> Optional[float]:
+    """
+    将恢复时间转换为 Unix 时间戳
+
+    兼容旧版本状态文件中的 ISO 格式时间字符串
+
+    Args:
+        value: Unix 时间戳、ISO 格式时间字符串或 None
+
+    Returns:
+        Unix 时间戳
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
 @dataclass
 class RecoveryResult:
     """恢复结果"""
+    # 每次处理失败工作流都会创建，使用 __slots__ 省去实例 __dict__
+    # （所有字段都没有默认值，可以直接与 dataclass 配合使用）
+    __slots__ = (
+        'workflow_instance', 'validation_result', 'recovery_executed',
+        'recovery_success', 'message', 'attempt_count'
+    )
+
     workflow_instance: WorkflowInstance
     validation_result: WorkflowValidationResult
     recovery_executed: bool
@@ -82,49 +118,192 @@ class RecoveryHandler:
         if state_file is None:
             state_file = Path(__file__).parent.parent / "logs" / "recovery_state.json"
         self.state_file = Path(state_file)
+        # 恢复历史追加日志（JSONL），每次恢复尝试只追加一行，避免整文件重写
+        self._history_file = self.state_file.with_name(self.state_file.stem + ".history.jsonl")
+        self._history_entries = 0
+
+        # 延迟写盘：窗口内的多次变更合并为一次写入
+        self._pending_history: List[Dict] = []  # 尚未写入日志的恢复尝试
+        self._dirty = False                      # 是否需要重写完整状态文件
+        self._flush_timer: Optional[Timer] = None
+
+        # 恢复记录可能被多个线程并发处理（并发恢复），读写需加锁
+        self._lock = RLock()
 
         # 加载恢复记录
         self._recovery_records: Dict[int, RecoveryRecord] = {}
+        # 恢复统计计数，随恢复尝试增量维护
+        self._total_attempts = 0
+        self._successful_recovery_ids: Set[int] = set()
         self._load_state()
+        self._rebuild_statistics()
+
+        # 进程退出前写入未保存的变更
+        atexit.register(self.flush)
 
     def _load_state(self) -> None:
         """从文件加载恢复状态"""
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = json.loads(f.read())
                     for key, value in data.items():
                         self._recovery_records[int(key)] = RecoveryRecord(
                             workflow_instance_id=value['workflow_instance_id'],
                             workflow_name=value['workflow_name'],
                             project_code=value['project_code'],
                             attempt_count=value.get('attempt_count', 0),
-                            last_attempt_time=value.get('last_attempt_time'),
-                            recovery_history=value.get('recovery_history', [])
+                            last_attempt_time=_to_timestamp(value.get('last_attempt_time')),
+                            recovery_history=[
+                                dict(h, time=_to_timestamp(h.get('time')))
+                                for h in value.get('recovery_history', [])
+                            ]
                         )
-                self.logger.debug(f"加载了 {len(self._recovery_records)} 条恢复记录")
             except Exception as e:
                 self.logger.warning(f"加载恢复状态失败: {e}")
 
+        self._replay_history()
+        self.logger.debug(f"加载了 {len(self._recovery_records)} 条恢复记录")
+
+    def _rebuild_statistics(self) -> None:
+        """根据已加载的恢复记录重建统计计数"""
+        records = self._recovery_records.values()
+        self._total_attempts = sum(r.attempt_count for r in records)
+        self._successful_recovery_ids = {
+            r.workflow_instance_id for r in records
+            if any(h.get('success', False) for h in r.recovery_history)
+        }
+
+    def _replay_history(self) -> None:
+        """重放状态文件之后追加的恢复历史日志"""
+        if not self._history_file.exists():
+            return
+
+        try:
+            with open(self._history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    self._history_entries += 1
+
+                    instance_id = entry['workflow_instance_id']
+                    record = self._recovery_records.get(instance_id)
+                    if record is None:
+                        record = RecoveryRecord(
+                            workflow_instance_id=instance_id,
+                            workflow_name=entry['workflow_name'],
+                            project_code=entry['project_code']
+                        )
+                        self._recovery_records[instance_id] = record
+
+                    # 已包含在状态文件中的尝试（写完状态文件后、清空日志前中断）跳过
+                    if entry['attempt'] <= record.attempt_count:
+                        continue
+
+                    attempt_time = _to_timestamp(entry['time'])
+                    record.attempt_count = entry['attempt']
+                    record.last_attempt_time = attempt_time
+                    record.recovery_history.append({
+                        'attempt': entry['attempt'],
+                        'time': attempt_time,
+                        'success': entry['success'],
+                        'message': entry['message']
+                    })
+        except Exception as e:
+            self.logger.warning(f"加载恢复历史日志失败: {e}")
+
     def _save_state(self) -> None:
-        """保存恢复状态到文件"""
+        """保存完整恢复状态到文件，并清空恢复历史日志"""
         try:
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            data = {}
-            for key, record in self._recovery_records.items():
-                data[str(key)] = {
-                    'workflow_instance_id': record.workflow_instance_id,
-                    'workflow_name': record.workflow_name,
-                    'project_code': record.project_code,
-                    'attempt_count': record.attempt_count,
-                    'last_attempt_time': record.last_attempt_time,
-                    'recovery_history': record.recovery_history
-                }
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                data = {}
+                for key, record in self._recovery_records.items():
+                    data[str(key)] = {
+                        'workflow_instance_id': record.workflow_instance_id,
+                        'workflow_name': record.workflow_name,
+                        'project_code': record.project_code,
+                        'attempt_count': record.attempt_count,
+                        'last_attempt_time': record.last_attempt_time,
+                        'recovery_history': record.recovery_history
+                    }
+                # 先写临时文件再原子替换，避免写入中断导致状态文件损坏
+                tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+                # json.dumps 走 C 编码器（json.dump 是逐段编码的纯 Python 路径），一次写入
+                content = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_file, self.state_file)
+
+                # 历史已包含在状态文件中，清空日志
+                if self._history_entries:
+                    open(self._history_file, 'w').close()
+                    self._history_entries = 0
+                self._pending_history.clear()
+                self._dirty = False
         except Exception as e:
             self.logger.warning(f"保存恢复状态失败: {e}")
 
+    def _schedule_save(self, full: bool = False) -> None:
+        """
+        标记待写盘，并在合并窗口结束后统一写入
+
+        Args:
+            full: 是否需要重写完整状态文件（否则只追加恢复历史日志）
+        """
+        with self._lock:
+            if full:
+                self._dirty = True
+            if self._flush_timer is not None and self._flush_timer.is_alive():
+                return
+            self._flush_timer = Timer(_SAVE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """立即写入未保存的变更"""
+        with self._lock:
+            # 先清除定时器引用：写盘结束后的变更会重新安排一次写盘，而不会因定时器仍存活被漏掉
+            self._flush_timer = None
+            pending = self._pending_history
+            if self._dirty or self._history_entries + len(pending) > _HISTORY_COMPACT_THRESHOLD:
+                self._save_state()
+                return
+            if not pending:
+                return
+
+            try:
+                self._history_file.parent.mkdir(parents=True, exist_ok=True)
+                lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in pending)
+                with open(self._history_file, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                self._history_entries += len(pending)
+                pending.clear()
+            except Exception as e:
+                self.logger.warning(f"保存恢复历史失败: {e}")
+
+    def _append_history(self, record: RecoveryRecord) -> None:
+        """
+        追加一条恢复尝试到历史日志（延迟写盘）
+
+        日志累计过多时改为重写完整状态文件
+
+        Args:
+            record: 刚添加了恢复尝试的恢复记录
+        """
+        attempt = record.recovery_history[-1]
+        entry = {
+            'workflow_instance_id': record.workflow_instance_id,
+            'workflow_name': record.workflow_name,
+            'project_code': record.project_code,
+            **attempt
+        }
+
+        with self._lock:
+            self._pending_history.append(entry)
+        self._schedule_save()
+
     def _get_recovery_record(
         self,
         workflow_instance: WorkflowInstance
@@ -132,14 +311,15 @@ class RecoveryHandler:
         """获取或创建恢复记录"""
         instance_id = workflow_instance.id
 
-        if instance_id not in self._recovery_records:
-            self._recovery_records[instance_id] = RecoveryRecord(
-                workflow_instance_id=instance_id,
-                workflow_name=workflow_instance.name,
-                project_code=workflow_instance.project_code
-            )
+        with self._lock:
+            if instance_id not in self._recovery_records:
+                self._recovery_records[instance_id] = RecoveryRecord(
+                    workflow_instance_id=instance_id,
+                    workflow_name=workflow_instance.name,
+                    project_code=workflow_instance.project_code
+                )
 
-        return self._recovery_records[instance_id]
+            return self._recovery_records[instance_id]
 
     def process_failed_workflow(
         self,
@@ -162,7 +342,12 @@ class RecoveryHandler:
         Returns:
             恢复结果
         """
-        self.logger.info(f"处理失败工作流: {workflow_instance.name} (ID: {workflow_instance.id})")
+        logger = self.logger
+        max_attempts = self.config.max_recovery_attempts
+        name = workflow_instance.name
+        instance_id = workflow_instance.id
+
+        logger.info(f"处理失败工作流: {name} (ID: {instance_id})")
 
         # 验证工作流
         validation_result = self.validator.validate_workflow_instance(
@@ -171,72 +356,68 @@ class RecoveryHandler:
         )
 
         record = self._get_recovery_record(workflow_instance)
+        attempt_count = record.attempt_count
 
         # 检查是否可以恢复
         if not validation_result.can_recover:
-            self.logger.info(
-                f"工作流 {workflow_instance.name} 不满足恢复条件: {validation_result.message}"
-            )
+            logger.info(f"工作流 {name} 不满足恢复条件: {validation_result.message}")
             return RecoveryResult(
                 workflow_instance=workflow_instance,
                 validation_result=validation_result,
                 recovery_executed=False,
                 recovery_success=False,
                 message=validation_result.message,
-                attempt_count=record.attempt_count
+                attempt_count=attempt_count
             )
 
         # 检查恢复次数限制
-        if record.attempt_count >= self.config.max_recovery_attempts:
-            message = (
-                f"工作流 {workflow_instance.name} 已达到最大恢复次数限制 "
-                f"({record.attempt_count}/{self.config.max_recovery_attempts})"
-            )
-            self.logger.warning(message)
+        if attempt_count >= max_attempts:
+            message = f"工作流 {name} 已达到最大恢复次数限制 ({attempt_count}/{max_attempts})"
+            logger.warning(message)
             return RecoveryResult(
                 workflow_instance=workflow_instance,
                 validation_result=validation_result,
                 recovery_executed=False,
                 recovery_success=False,
                 message=message,
-                attempt_count=record.attempt_count
+                attempt_count=attempt_count
             )
 
         # 检查是否启用自动恢复
         if not self.config.auto_recovery:
-            message = f"工作流 {workflow_instance.name} 满足恢复条件，但自动恢复已禁用"
-            self.logger.info(message)
+            message = f"工作流 {name} 满足恢复条件，但自动恢复已禁用"
+            logger.info(message)
             return RecoveryResult(
                 workflow_instance=workflow_instance,
                 validation_result=validation_result,
                 recovery_executed=False,
                 recovery_success=False,
                 message=message,
-                attempt_count=record.attempt_count
+                attempt_count=attempt_count
             )
 
         # 执行恢复
-        self.logger.info(
-            f"开始恢复工作流: {workflow_instance.name} "
-            f"(第 {record.attempt_count + 1}/{self.config.max_recovery_attempts} 次尝试)"
-        )
+        logger.info(f"开始恢复工作流: {name} (第 {attempt_count + 1}/{max_attempts} 次尝试)")
 
-        success = self.client.execute_failure_recovery(
-            project_code,
-            workflow_instance.id
-        )
+        success = self.client.execute_failure_recovery(project_code, instance_id)
 
         if success:
-            message = f"工作流 {workflow_instance.name} 恢复操作已提交"
-            self.logger.success(message)
-            record.add_attempt(True, message)
+            message = f"工作流 {name} 恢复操作已提交"
+            logger.success(message)
         else:
-            message = f"工作流 {workflow_instance.name} 恢复操作失败"
-            self.logger.error(message)
-            record.add_attempt(False, message)
+            message = f"工作流 {name} 恢复操作失败"
+            logger.error(message)
+
+        # 记录会被写盘定时器线程在锁内序列化，修改也需持锁
+        with self._lock:
+            record.add_attempt(success, message)
+            attempt_count = record.attempt_count
+            self._total_attempts += 1
+            if success:
+                self._successful_recovery_ids.add(instance_id)
 
         # 保存状态
-        self._save_state()
+        self._append_history(record)
 
         return RecoveryResult(
             workflow_instance=workflow_instance,
@@ -244,22 +425,15 @@ class RecoveryHandler:
             recovery_executed=True,
             recovery_success=success,
             message=message,
-            attempt_count=record.attempt_count
+            attempt_count=attempt_count
         )
 
     def get_recovery_statistics(self) -> Dict:
         """获取恢复统计信息"""
-        total_records = len(self._recovery_records)
-        total_attempts = sum(r.attempt_count for r in self._recovery_records.values())
-        successful_recoveries = sum(
-            1 for r in self._recovery_records.values()
-            if any(h.get('success', False) for h in r.recovery_history)
-        )
-
         return {
-            'total_workflows_tracked': total_records,
-            'total_recovery_attempts': total_attempts,
-            'successful_recoveries': successful_recoveries,
+            'total_workflows_tracked': len(self._recovery_records),
+            'total_recovery_attempts': self._total_attempts,
+            'successful_recoveries': len(self._successful_recovery_ids),
             'max_recovery_limit': self.config.max_recovery_attempts,
             'auto_recovery_enabled': self.config.auto_recovery
         }
@@ -274,12 +448,15 @@ class RecoveryHandler:
         Returns:
             是否成功
         """
-        if workflow_instance_id in self._recovery_records:
-            del self._recovery_records[workflow_instance_id]
-            self._save_state()
-            self.logger.info(f"已清除工作流实例 {workflow_instance_id} 的恢复记录")
-            return True
-        return False
+        with self._lock:
+            record = self._recovery_records.pop(workflow_instance_id, None)
+            if record is None:
+                return False
+            self._total_attempts -= record.attempt_count
+            self._successful_recovery_ids.discard(workflow_instance_id)
+            self._schedule_save(full=True)
+        self.logger.info(f"已清除工作流实例 {workflow_instance_id} 的恢复记录")
+        return True
 
     def clear_all_records(self) -> int:
         """
@@ -288,9 +465,12 @@ class RecoveryHandler:
         Returns:
             清除的记录数量
         """
-        count = len(self._recovery_records)
-        self._recovery_records.clear()
-        self._save_state()
+        with self._lock:
+            count = len(self._recovery_records)
+            self._recovery_records.clear()
+            self._total_attempts = 0
+            self._successful_recovery_ids.clear()
+            self._schedule_save(full=True)
         self.logger.info(f"已清除所有恢复记录 (共 {count} 条)")
         return count
 
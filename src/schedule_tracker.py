@@ -4,18 +4,47 @@
 追踪工作流的调度状态，实现智能监控决策
 """
 
+import atexit
 import json
+import os
+import functools
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import Any, Counter as CounterType, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from threading import RLock
+from threading import Lock, Timer
 from enum import Enum
 
 from .cron_parser import CronParser, SchedulePeriod
 from .logger import get_logger
 
 
+# Cron 解析器缓存的最大条目数
+_PARSER_CACHE_SIZE = 256
+
+# 调度周期缓存的最大条目数
+_PERIOD_CACHE_SIZE = 4096
+
+# 工作流状态分段锁数量（必须是 2 的幂）
+_LOCK_STRIPES = 16
+
+# 批量决策并发线程数
+_DECISION_WORKERS = 8
+
+# 不含变量的决策原因（所有工作流共用同一个字符串对象）
+_REASON_UNREGISTERED = "未注册的工作流，执行完整监控"
+_REASON_FAILED = "本周期失败，持续监控直到恢复"
+_REASON_IN_WINDOW = "在执行窗口内，检查工作流状态"
+
+# 带参数的决策原因模板（访问 MonitorDecision.reason 时才格式化）
+_REASON_OUT_OF_WINDOW = "不在执行窗口内，下次调度: {:%Y-%m-%d %H:%M}"
+_REASON_SUCCESS = "本周期已成功 ({})，跳过监控"
+_REASON_COOLDOWN = "刚恢复成功，冷却中 (剩余 {} 分钟)"
+
+
 class WorkflowPeriodStatus(Enum):
     """工作流周期状态"""
     PENDING = "pending"           # 等待执行（调度时间未到）
@@ -26,6 +55,13 @@ class WorkflowPeriodStatus(Enum):
     RECOVERED = "recovered"       # 已恢复
 
 
+# 状态字符串常量（状态以字符串保存，热路径比较时避免每次访问枚举的 .value）
+_STATUS_PENDING = WorkflowPeriodStatus.PENDING.value
+_STATUS_SUCCESS = WorkflowPeriodStatus.SUCCESS.value
+_STATUS_FAILED = WorkflowPeriodStatus.FAILED.value
+_STATUS_RECOVERED = WorkflowPeriodStatus.RECOVERED.value
+
+
 @dataclass
 class WorkflowScheduleState:
     """工作流调度状态"""
@@ -38,7 +74,7 @@ class WorkflowScheduleState:
     # 当前周期信息
     current_period_start: Optional[str] = None   # 当前周期开始时间
     current_period_end: Optional[str] = None     # 当前周期结束时间
-    status: str = WorkflowPeriodStatus.PENDING.value
+    status: str = _STATUS_PENDING
 
     # 最近实例信息
     last_instance_id: Optional[int] = None
@@ -50,25 +86,219 @@ class WorkflowScheduleState:
     failure_time: Optional[str] = None
     recovery_time: Optional[str] = None
 
+    # 解析后的恢复时间缓存 (recovery_time 字符串, datetime)，不持久化
+    _recovery_dt: Optional[Tuple[str, datetime]] = field(default=None, repr=False, compare=False)
+    # 本进程内标记恢复时的单调时钟读数，不持久化（从文件加载的状态为 None）
+    _recovery_monotonic: Optional[float] = field(default=None, repr=False, compare=False)
+    # current_period_start 对应的 datetime，不持久化
+    _period_start_dt: Optional[datetime] = field(default=None, repr=False, compare=False)
+
     def to_dict(self) -> dict:
-        """转换为字典"""
-        return asdict(self)
+        """转换为字典（不含下划线开头的缓存字段，字段均为不可变的基本类型）"""
+        return {
+            'project_code': self.project_code,
+            'project_name': self.project_name,
+            'workflow_code': self.workflow_code,
+            'workflow_name': self.workflow_name,
+            'cron_expression': self.cron_expression,
+            'current_period_start': self.current_period_start,
+            'current_period_end': self.current_period_end,
+            'status': self.status,
+            'last_instance_id': self.last_instance_id,
+            'last_instance_status': self.last_instance_status,
+            'last_check_time': self.last_check_time,
+            'success_time': self.success_time,
+            'failure_time': self.failure_time,
+            'recovery_time': self.recovery_time,
+        }
+
+    def is_current_period(self, period_start: datetime) -> bool:
+        """
+        判断给定的周期开始时间是否为当前记录的周期
+
+        直接比较 datetime，只有从文件加载后首次比较时才格式化字符串。
+
+        Args:
+            period_start: 周期开始时间
+
+        Returns:
+            是否为当前周期
+        """
+        current = self._period_start_dt
+        if current is not None:
+            return current == period_start
+
+        if self.current_period_start != period_start.isoformat():
+            return False
+        self._period_start_dt = period_start
+        return True
+
+    def get_recovery_datetime(self) -> Optional[datetime]:
+        """
+        获取恢复时间（解析结果按 recovery_time 字符串缓存）
+
+        Returns:
+            恢复时间，未恢复时为 None
+        """
+        recovery_time = self.recovery_time
+        if not recovery_time:
+            return None
+
+        cached = self._recovery_dt
+        if cached is None or cached[0] != recovery_time:
+            cached = (recovery_time, datetime.fromisoformat(recovery_time))
+            self._recovery_dt = cached
+        return cached[1]
 
     @classmethod
     def from_dict(cls, data: dict) -> 'WorkflowScheduleState':
-        """从字典创建"""
+        """从字典创建（忽略未知字段，兼容其他版本写入的状态文件）"""
+        if data.keys() - _STATE_FIELDS:
+            data = {key: value for key, value in data.items() if key in _STATE_FIELDS}
         return cls(**data)
 
 
-@dataclass
+# 持久化的状态字段
+_STATE_FIELDS = frozenset(
+    f.name for f in fields(WorkflowScheduleState) if not f.name.startswith('_')
+)
+
+
 class MonitorDecision:
-    """监控决策"""
-    should_monitor: bool          # 是否需要监控
-    should_query_api: bool        # 是否需要调用 API
-    reason: str                   # 决策原因
-    workflow_code: int
-    workflow_name: str
-    current_status: str
+    """
+    监控决策
+
+    带参数的决策原因只保存模板和参数，首次访问 reason 时才格式化；
+    调用方只关心 should_query_api 时不产生字符串格式化开销。
+    """
+    # 每个工作流每轮检查都会创建，使用 __slots__ 省去实例 __dict__
+    __slots__ = (
+        'should_monitor', 'should_query_api', 'workflow_code', 'workflow_name',
+        'current_status', '_reason_template', '_reason_args', '_reason'
+    )
+
+    def __init__(
+        self,
+        should_monitor: bool,
+        should_query_api: bool,
+        reason: str,
+        workflow_code: int,
+        workflow_name: str,
+        current_status: str,
+        reason_args: Tuple[Any, ...] = ()
+    ):
+        """
+        初始化监控决策
+
+        Args:
+            should_monitor: 是否需要监控
+            should_query_api: 是否需要调用 API
+            reason: 决策原因（提供 reason_args 时为 str.format 模板）
+            workflow_code: 工作流编码
+            workflow_name: 工作流名称
+            current_status: 当前状态
+            reason_args: 决策原因模板参数
+        """
+        self.should_monitor = should_monitor
+        self.should_query_api = should_query_api
+        self.workflow_code = workflow_code
+        self.workflow_name = workflow_name
+        self.current_status = current_status
+        self._reason_template = reason
+        self._reason_args = reason_args
+        self._reason: Optional[str] = None if reason_args else reason
+
+    @property
+    def reason(self) -> str:
+        """决策原因"""
+        reason = self._reason
+        if reason is None:
+            reason = self._reason_template.format(*self._reason_args)
+            self._reason = reason
+        return reason
+
+    def _astuple(self) -> tuple:
+        return (
+            self.should_monitor, self.should_query_api, self.reason,
+            self.workflow_code, self.workflow_name, self.current_status
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MonitorDecision):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __repr__(self) -> str:
+        return (
+            f"MonitorDecision(should_monitor={self.should_monitor!r}, "
+            f"should_query_api={self.should_query_api!r}, reason={self.reason!r}, "
+            f"workflow_code={self.workflow_code!r}, workflow_name={self.workflow_name!r}, "
+            f"current_status={self.current_status!r})"
+        )
+
+
+@functools.lru_cache(maxsize=_PARSER_CACHE_SIZE)
+def _cached_parser(cron_expression: str) -> CronParser:
+    """
+    获取 Cron 解析器（按表达式缓存，进程内共享）
+
+    Args:
+        cron_expression: Cron 表达式
+
+    Returns:
+        Cron 解析器
+
+    Raises:
+        ValueError: Cron 表达式无效
+    """
+    return CronParser(cron_expression)
+
+
+# 调度周期缓存：{(cron 表达式, 执行窗口时长): (生效时间戳, 失效时间戳, 调度周期)}
+_period_cache: Dict[Tuple[str, int], Tuple[float, float, SchedulePeriod]] = {}
+_period_cache_lock = Lock()
+
+
+def _cached_period(cron_expression: str, execution_window_hours: int) -> SchedulePeriod:
+    """
+    计算调度周期（缓存到周期或执行窗口的下一个边界）
+
+    缓存按计算出的边界失效而不是按固定时间间隔，秒级 cron（如 "*/30 * * * * ?"）
+    跨过周期边界时不会读到过期的周期；相同 cron 表达式的工作流共享计算结果。
+
+    Args:
+        cron_expression: Cron 表达式
+        execution_window_hours: 执行窗口时长（小时）
+
+    Returns:
+        当前调度周期
+
+    Raises:
+        ValueError: Cron 表达式无效
+    """
+    key = (cron_expression, execution_window_hours)
+    now = time.time()
+    entry = _period_cache.get(key)
+    if entry is not None and entry[0] <= now < entry[1]:
+        return entry[2]
+
+    period = _cached_parser(cron_expression).get_schedule_period(
+        reference_time=datetime.fromtimestamp(now),
+        execution_window_hours=execution_window_hours
+    )
+
+    # 下一个边界：进入下个周期，或在窗口内时执行窗口结束
+    expires_at = period.next_start
+    if period.is_in_execution_window:
+        expires_at = min(expires_at, period.current_start + timedelta(hours=execution_window_hours))
+
+    with _period_cache_lock:
+        if key not in _period_cache and len(_period_cache) >= _PERIOD_CACHE_SIZE:
+            # 淘汰最早加入的条目
+            del _period_cache[next(iter(_period_cache))]
+        _period_cache[key] = (period.current_start.timestamp(), expires_at.timestamp(), period)
+
+    return period
 
 
 class ScheduleTracker:
@@ -79,13 +309,22 @@ class ScheduleTracker:
     1. 追踪每个工作流的调度状态
     2. 根据调度时间决定是否需要监控
     3. 记录成功/失败状态避免重复查询
+
+    并发模型：
+    - 每个工作流的状态及其解析器/周期缓存由按键分段的锁保护，
+      不同工作流的决策和状态更新可以并行进行
+    - _lock 只保护 _states 的增删、延迟写盘标记和快照序号，持有时间很短
+    - 锁顺序固定为 分段锁 -> _lock，写盘快照逐个工作流获取分段锁，不会同时持有 _lock
+    - 快照按工作流逐个复制，每个工作流的状态自身一致，不同工作流之间不保证是同一时刻
     """
 
     def __init__(
         self,
         state_file: str = "data/schedule_state.json",
         execution_window_hours: int = 4,
-        success_cooldown_minutes: int = 30
+        success_cooldown_minutes: int = 30,
+        flush_interval: float = 5.0,
+        parallel: bool = True
     ):
         """
         初始化追踪器
@@ -94,23 +333,53 @@ class ScheduleTracker:
             state_file: 状态文件路径
             execution_window_hours: 执行窗口时长（小时）
             success_cooldown_minutes: 成功后冷却时间（分钟）
+            flush_interval: 状态写盘的最小间隔（秒），间隔内的多次变更合并为一次写入
+            parallel: 批量决策时是否在线程池中并发计算各工作流的决策
         """
         self.state_file = Path(state_file)
         self.execution_window_hours = execution_window_hours
         self.success_cooldown_minutes = success_cooldown_minutes
+        self.flush_interval = flush_interval
+        self.parallel = parallel
         self.logger = get_logger()
-        self._lock = RLock()
+        self._lock = Lock()
+        # 工作流状态分段锁：按状态键哈希选择
+        self._locks = [Lock() for _ in range(_LOCK_STRIPES)]
+        # 批量决策使用的线程池（首次并发决策时创建）
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 串行化写盘（写盘在 _lock 之外进行）
+        self._write_lock = Lock()
+
+        # 延迟写盘状态
+        self._dirty = False
+        self._flush_timer: Optional[Timer] = None
+        # 快照序号：保证较旧的快照不会覆盖较新的快照
+        self._snapshot_seq = 0
+        self._written_seq = 0
+        # 最近一次写入的状态内容（不含 updated_at），内容未变化时跳过写盘
+        self._last_states_json: Optional[str] = None
 
         # 工作流状态: {project_code}_{workflow_code} -> WorkflowScheduleState
         self._states: Dict[str, WorkflowScheduleState] = {}
 
+        # 各状态的工作流数量，随状态变更增量维护（由 _lock 保护），get_stats 无需遍历全部状态
+        self._status_counts: CounterType[str] = Counter()
+
         # 加载持久化状态
         self._load_state()
+        self._status_counts.update(state.status for state in self._states.values())
+
+        # 进程退出前写入未保存的变更
+        atexit.register(self.flush)
 
     def _get_key(self, project_code: int, workflow_code: int) -> str:
         """生成状态键"""
         return f"{project_code}_{workflow_code}"
 
+    def _key_lock(self, key: str) -> Lock:
+        """获取状态键对应的分段锁"""
+        return self._locks[hash(key) & (_LOCK_STRIPES - 1)]
+
     def _load_state(self) -> None:
         """加载持久化状态"""
         if not self.state_file.exists():
@@ -118,28 +387,93 @@ class ScheduleTracker:
 
         try:
             with open(self.state_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for key, state_data in data.get('states', {}).items():
-                    self._states[key] = WorkflowScheduleState.from_dict(state_data)
+                data = json.loads(f.read())
+            for key, state_data in data.get('states', {}).items():
+                self._states[key] = WorkflowScheduleState.from_dict(state_data)
             self.logger.debug(f"加载调度状态: {len(self._states)} 个工作流")
         except Exception as e:
             self.logger.warning(f"加载调度状态失败: {e}")
 
     def _save_state(self) -> None:
-        """保存状态到文件"""
-        try:
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                'updated_at': datetime.now().isoformat(),
-                'states': {
-                    key: state.to_dict()
-                    for key, state in self._states.items()
-                }
-            }
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.warning(f"保存调度状态失败: {e}")
+        """标记状态待写盘，在 flush_interval 之后统一写入"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None and self._flush_timer.is_alive():
+                return
+
+            self._flush_timer = Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _take_snapshot(self) -> Optional[Tuple[int, Dict[str, Dict[str, Any]]]]:
+        """
+        复制当前状态用于写盘（调用方不应持有任何锁）
+
+        Returns:
+            (快照序号, {状态键: 状态字典})，没有未保存的变更时为 None
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+            # 先清除标记：复制期间发生的变更会重新标记，由下一次写盘保存
+            self._dirty = False
+            self._snapshot_seq += 1
+            seq = self._snapshot_seq
+            items = list(self._states.items())
+
+        states = {}
+        for key, state in items:
+            with self._key_lock(key):
+                states[key] = state.to_dict()
+
+        return seq, states
+
+    def _write_snapshot(self, seq: int, states: Dict[str, Dict[str, Any]]) -> None:
+        """
+        将状态快照写入文件（调用方不应持有 _lock）
+
+        Args:
+            seq: 快照序号
+            states: {状态键: 状态字典}
+        """
+        with self._write_lock:
+            # 已有更新的快照写入，跳过
+            if seq <= self._written_seq:
+                return
+
+            try:
+                # 状态文件只供程序读取：不缩进，json.dumps 走 C 编码器
+                states_json = json.dumps(states, ensure_ascii=False, separators=(',', ':'))
+                # 直接比较字符串：与哈希比较开销相当，且不会因哈希碰撞误跳过写盘
+                if states_json == self._last_states_json:
+                    # 与上次写入的内容相同，无需重写
+                    self._written_seq = seq
+                    return
+
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # 先写临时文件再原子替换，避免写入中断导致状态文件损坏
+                tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+                content = f'{{"updated_at":"{datetime.now().isoformat()}","states":{states_json}}}'
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_file, self.state_file)
+
+                self._written_seq = seq
+                self._last_states_json = states_json
+            except Exception as e:
+                self.logger.warning(f"保存调度状态失败: {e}")
+                # 标记为待写盘，并在 flush_interval 之后重试
+                self._save_state()
+
+    def flush(self) -> None:
+        """立即写入未保存的变更"""
+        with self._lock:
+            # 先清除定时器引用：写盘期间发生的变更会重新安排一次写盘，而不会因定时器仍存活被漏掉
+            self._flush_timer = None
+        snapshot = self._take_snapshot()
+        if snapshot is not None:
+            self._write_snapshot(*snapshot)
 
     def register_workflow(
         self,
@@ -161,65 +495,122 @@ class ScheduleTracker:
         """
         key = self._get_key(project_code, workflow_code)
 
-        with self._lock:
+        with self._key_lock(key):
             if key not in self._states:
-                self._states[key] = WorkflowScheduleState(
+                state = WorkflowScheduleState(
                     project_code=project_code,
                     project_name=project_name,
                     workflow_code=workflow_code,
                     workflow_name=workflow_name,
                     cron_expression=cron_expression
                 )
-                self.logger.debug(
-                    f"注册工作流调度: {workflow_name} ({cron_expression})"
-                )
+                with self._lock:
+                    self._states[key] = state
+                    self._status_counts[state.status] += 1
+                if self.logger.is_debug_enabled():
+                    self.logger.debug(
+                        f"注册工作流调度: {workflow_name} ({cron_expression})"
+                    )
             else:
-                # 更新 cron 表达式（可能变更）
-                self._states[key].cron_expression = cron_expression
+                # 更新 cron 表达式（可能变更，周期缓存按表达式区分，无需清理）
+                state = self._states[key]
+                if state.cron_expression != cron_expression:
+                    state.cron_expression = cron_expression
 
-    def update_period(self, project_code: int, workflow_code: int) -> None:
+    def update_period(self, project_code: int, workflow_code: int) -> Optional[SchedulePeriod]:
         """
         更新工作流的周期信息
 
         Args:
             project_code: 项目编码
             workflow_code: 工作流编码
+
+        Returns:
+            当前调度周期（未注册或 Cron 解析失败时为 None）
         """
         key = self._get_key(project_code, workflow_code)
 
-        with self._lock:
-            if key not in self._states:
-                return
+        with self._key_lock(key):
+            state = self._states.get(key)
+            if state is None:
+                return None
 
-            state = self._states[key]
             try:
-                parser = CronParser(state.cron_expression)
-                period = parser.get_schedule_period(
-                    execution_window_hours=self.execution_window_hours
-                )
-
-                # 检查是否进入新周期
-                new_period_start = period.current_start.isoformat()
-                if state.current_period_start != new_period_start:
-                    # 新周期，重置状态
-                    state.current_period_start = new_period_start
-                    state.current_period_end = period.current_end.isoformat()
-                    state.status = WorkflowPeriodStatus.PENDING.value
-                    state.last_instance_id = None
-                    state.last_instance_status = None
-                    state.success_time = None
-                    state.failure_time = None
-                    state.recovery_time = None
-                    self.logger.debug(
-                        f"工作流 {state.workflow_name} 进入新周期: {new_period_start}"
-                    )
-                    # 持久化状态，确保程序重启后状态正确
-                    self._save_state()
-
+                return self._refresh_period(state)
             except Exception as e:
                 self.logger.warning(
                     f"更新周期信息失败 ({state.workflow_name}): {e}"
                 )
+                return None
+
+    def _set_status(self, state: WorkflowScheduleState, status: str) -> None:
+        """
+        更新工作流状态并维护状态计数（调用方需持有该工作流的分段锁）
+
+        Args:
+            state: 工作流调度状态
+            status: 新状态
+        """
+        old_status = state.status
+        if old_status == status:
+            return
+        with self._lock:
+            self._status_counts[old_status] -= 1
+            self._status_counts[status] += 1
+        state.status = status
+
+    def _get_period(self, state: WorkflowScheduleState) -> SchedulePeriod:
+        """
+        获取当前调度周期（到下一个周期边界之前复用计算结果）
+
+        Args:
+            state: 工作流调度状态
+
+        Returns:
+            当前调度周期
+
+        Raises:
+            ValueError: Cron 表达式无效
+        """
+        return _cached_period(state.cron_expression, self.execution_window_hours)
+
+    def _refresh_period(self, state: WorkflowScheduleState) -> SchedulePeriod:
+        """
+        计算当前调度周期，进入新周期时重置状态（调用方需持有该工作流的分段锁）
+
+        Args:
+            state: 工作流调度状态
+
+        Returns:
+            当前调度周期
+
+        Raises:
+            ValueError: Cron 表达式无效
+        """
+        period = self._get_period(state)
+
+        # 检查是否进入新周期
+        if not state.is_current_period(period.current_start):
+            # 新周期，重置状态
+            new_period_start = period.current_start.isoformat()
+            state.current_period_start = new_period_start
+            state._period_start_dt = period.current_start
+            state.current_period_end = period.current_end.isoformat()
+            self._set_status(state, _STATUS_PENDING)
+            state.last_instance_id = None
+            state.last_instance_status = None
+            state.success_time = None
+            state.failure_time = None
+            state.recovery_time = None
+            state._recovery_monotonic = None
+            if self.logger.is_debug_enabled():
+                self.logger.debug(
+                    f"工作流 {state.workflow_name} 进入新周期: {new_period_start}"
+                )
+            # 持久化状态，确保程序重启后状态正确
+            self._save_state()
+
+        return period
 
     def mark_success(
         self,
@@ -237,14 +628,15 @@ class ScheduleTracker:
         """
         key = self._get_key(project_code, workflow_code)
 
-        with self._lock:
-            if key in self._states:
-                state = self._states[key]
-                state.status = WorkflowPeriodStatus.SUCCESS.value
-                state.success_time = datetime.now().isoformat()
+        with self._key_lock(key):
+            state = self._states.get(key)
+            if state is not None:
+                now_str = datetime.now().isoformat()
+                self._set_status(state, _STATUS_SUCCESS)
+                state.success_time = now_str
                 state.last_instance_id = instance_id
                 state.last_instance_status = "SUCCESS"
-                state.last_check_time = datetime.now().isoformat()
+                state.last_check_time = now_str
                 self._save_state()
                 self.logger.info(
                     f"工作流 {state.workflow_name} 本周期执行成功，跳过后续监控"
@@ -266,14 +658,15 @@ class ScheduleTracker:
         """
         key = self._get_key(project_code, workflow_code)
 
-        with self._lock:
-            if key in self._states:
-                state = self._states[key]
-                state.status = WorkflowPeriodStatus.FAILED.value
-                state.failure_time = datetime.now().isoformat()
+        with self._key_lock(key):
+            state = self._states.get(key)
+            if state is not None:
+                now_str = datetime.now().isoformat()
+                self._set_status(state, _STATUS_FAILED)
+                state.failure_time = now_str
                 state.last_instance_id = instance_id
                 state.last_instance_status = "FAILURE"
-                state.last_check_time = datetime.now().isoformat()
+                state.last_check_time = now_str
                 self._save_state()
 
     def mark_recovered(
@@ -292,13 +685,17 @@ class ScheduleTracker:
         """
         key = self._get_key(project_code, workflow_code)
 
-        with self._lock:
-            if key in self._states:
-                state = self._states[key]
-                state.status = WorkflowPeriodStatus.RECOVERED.value
-                state.recovery_time = datetime.now().isoformat()
+        with self._key_lock(key):
+            state = self._states.get(key)
+            if state is not None:
+                now = datetime.now()
+                now_str = now.isoformat()
+                self._set_status(state, _STATUS_RECOVERED)
+                state.recovery_time = now_str
+                state._recovery_dt = (now_str, now)
+                state._recovery_monotonic = time.monotonic()
                 state.last_instance_id = instance_id
-                state.last_check_time = datetime.now().isoformat()
+                state.last_check_time = now_str
                 self._save_state()
                 self.logger.info(
                     f"工作流 {state.workflow_name} 已恢复成功"
@@ -312,6 +709,9 @@ class ScheduleTracker:
         """
         做出监控决策
 
+        本周期已成功、或恢复后仍在冷却期的工作流先走无锁快速路径（见 _fast_decision），
+        其余情况持有分段锁更新周期后再决策。
+
         Args:
             project_code: 项目编码
             workflow_code: 工作流编码
@@ -321,29 +721,32 @@ class ScheduleTracker:
         """
         key = self._get_key(project_code, workflow_code)
 
-        with self._lock:
-            if key not in self._states:
+        # 快速路径：单次 dict 读取在 GIL 下是原子的，无需持锁
+        state = self._states.get(key)
+        if state is not None:
+            decision = self._fast_decision(state, workflow_code)
+            if decision is not None:
+                return decision
+
+        with self._key_lock(key):
+            state = self._states.get(key)
+            if state is None:
                 return MonitorDecision(
                     should_monitor=True,
                     should_query_api=True,
-                    reason="未注册的工作流，执行完整监控",
+                    reason=_REASON_UNREGISTERED,
                     workflow_code=workflow_code,
                     workflow_name="未知",
                     current_status="unknown"
                 )
 
-            state = self._states[key]
-
-            # 更新周期信息
-            self.update_period(project_code, workflow_code)
-
-            # 获取当前调度周期
+            # 更新周期信息并获取当前调度周期
             try:
-                parser = CronParser(state.cron_expression)
-                period = parser.get_schedule_period(
-                    execution_window_hours=self.execution_window_hours
-                )
+                period = self._refresh_period(state)
             except Exception as e:
+                self.logger.warning(
+                    f"更新周期信息失败 ({state.workflow_name}): {e}"
+                )
                 return MonitorDecision(
                     should_monitor=True,
                     should_query_api=True,
@@ -353,46 +756,29 @@ class ScheduleTracker:
                     current_status=state.status
                 )
 
-            now = datetime.now()
+            status = state.status
 
             # 决策逻辑
             # 1. 本周期已成功 -> 跳过
-            if state.status == WorkflowPeriodStatus.SUCCESS.value:
-                return MonitorDecision(
-                    should_monitor=False,
-                    should_query_api=False,
-                    reason=f"本周期已成功 ({state.success_time})，跳过监控",
-                    workflow_code=workflow_code,
-                    workflow_name=state.workflow_name,
-                    current_status=state.status
-                )
+            if status == _STATUS_SUCCESS:
+                return self._success_decision(state, workflow_code)
 
             # 2. 本周期已恢复 -> 跳过（短时间内）
-            if state.status == WorkflowPeriodStatus.RECOVERED.value:
-                if state.recovery_time:
-                    recovery_time = datetime.fromisoformat(state.recovery_time)
-                    cooldown = timedelta(minutes=self.success_cooldown_minutes)
-                    if now - recovery_time < cooldown:
-                        remaining = cooldown - (now - recovery_time)
-                        return MonitorDecision(
-                            should_monitor=False,
-                            should_query_api=False,
-                            reason=f"刚恢复成功，冷却中 (剩余 {remaining.seconds // 60} 分钟)",
-                            workflow_code=workflow_code,
-                            workflow_name=state.workflow_name,
-                            current_status=state.status
-                        )
+            if status == _STATUS_RECOVERED:
+                decision = self._cooldown_decision(state, workflow_code)
+                if decision is not None:
+                    return decision
 
             # 3. 本周期已失败 -> 始终持续监控，不受执行窗口限制
             # 必须在执行窗口检查之前判断，确保失败的工作流在窗口外也能被持续跟踪
-            if state.status == WorkflowPeriodStatus.FAILED.value:
+            if status == _STATUS_FAILED:
                 return MonitorDecision(
                     should_monitor=True,
                     should_query_api=True,
-                    reason="本周期失败，持续监控直到恢复",
+                    reason=_REASON_FAILED,
                     workflow_code=workflow_code,
                     workflow_name=state.workflow_name,
-                    current_status=state.status
+                    current_status=status
                 )
 
             # 4. 不在执行窗口内 -> 跳过
@@ -400,22 +786,110 @@ class ScheduleTracker:
                 return MonitorDecision(
                     should_monitor=False,
                     should_query_api=False,
-                    reason=f"不在执行窗口内，下次调度: {period.next_start.strftime('%Y-%m-%d %H:%M')}",
+                    reason=_REASON_OUT_OF_WINDOW,
+                    reason_args=(period.next_start,),
                     workflow_code=workflow_code,
                     workflow_name=state.workflow_name,
-                    current_status=state.status
+                    current_status=status
                 )
 
             # 5. 在执行窗口内，状态待定 -> 需要查询
             return MonitorDecision(
                 should_monitor=True,
                 should_query_api=True,
-                reason="在执行窗口内，检查工作流状态",
+                reason=_REASON_IN_WINDOW,
                 workflow_code=workflow_code,
                 workflow_name=state.workflow_name,
-                current_status=state.status
+                current_status=status
             )
 
+    def _fast_decision(
+        self,
+        state: WorkflowScheduleState,
+        workflow_code: int
+    ) -> Optional[MonitorDecision]:
+        """
+        无锁快速路径：不需要修改状态即可确定的决策
+
+        只处理本周期已成功、或恢复后仍在冷却期的工作流，并且要求当前调度周期
+        与状态记录的周期一致（否则需要进入新周期，由加锁路径处理）。
+
+        一致性：不持锁读取状态字段，与并发的 mark_* 交错时可能基于更新前的状态做出决策，
+        效果等同于该决策在更新之前完成；下一次决策会看到更新后的状态。
+
+        Args:
+            state: 工作流调度状态
+            workflow_code: 工作流编码
+
+        Returns:
+            监控决策，无法在快速路径确定时为 None
+        """
+        status = state.status
+        if status != _STATUS_SUCCESS and status != _STATUS_RECOVERED:
+            return None
+
+        try:
+            period = self._get_period(state)
+        except Exception:
+            # Cron 解析失败由加锁路径记录日志并处理
+            return None
+        if not state.is_current_period(period.current_start):
+            return None
+
+        if status == _STATUS_SUCCESS:
+            return self._success_decision(state, workflow_code)
+        return self._cooldown_decision(state, workflow_code)
+
+    @staticmethod
+    def _success_decision(state: WorkflowScheduleState, workflow_code: int) -> MonitorDecision:
+        """本周期已成功时的决策"""
+        return MonitorDecision(
+            should_monitor=False,
+            should_query_api=False,
+            reason=_REASON_SUCCESS,
+            reason_args=(state.success_time,),
+            workflow_code=workflow_code,
+            workflow_name=state.workflow_name,
+            current_status=_STATUS_SUCCESS
+        )
+
+    def _cooldown_decision(
+        self,
+        state: WorkflowScheduleState,
+        workflow_code: int
+    ) -> Optional[MonitorDecision]:
+        """
+        恢复成功后冷却期内的决策
+
+        本进程内标记的恢复直接比较单调时钟；从文件加载的恢复记录回退到解析 recovery_time。
+
+        Returns:
+            监控决策，不在冷却期内时为 None
+        """
+        cooldown_seconds = self.success_cooldown_minutes * 60
+        recovery_monotonic = state._recovery_monotonic
+        if recovery_monotonic is not None:
+            elapsed = time.monotonic() - recovery_monotonic
+        else:
+            recovery_time = state.get_recovery_datetime()
+            if recovery_time is None:
+                return None
+            elapsed = (datetime.now() - recovery_time).total_seconds()
+
+        if elapsed >= cooldown_seconds:
+            return None
+
+        remaining_minutes = int(cooldown_seconds - elapsed) // 60
+        return MonitorDecision(
+            should_monitor=False,
+            should_query_api=False,
+            reason=_REASON_COOLDOWN,
+            reason_args=(remaining_minutes,),
+            workflow_code=workflow_code,
+            workflow_name=state.workflow_name,
+            current_status=_STATUS_RECOVERED
+        )
+
     def get_all_decisions(
         self,
         project_code: int,
@@ -424,6 +898,8 @@ class ScheduleTracker:
         """
         批量获取监控决策
 
+        各工作流的状态由不同的分段锁保护，parallel 启用时在线程池中并发决策。
+
         Args:
             project_code: 项目编码
             workflow_codes: 工作流编码列表
@@ -431,10 +907,38 @@ class ScheduleTracker:
         Returns:
             {workflow_code: MonitorDecision}
         """
-        decisions = {}
-        for wf_code in workflow_codes:
-            decisions[wf_code] = self.make_decision(project_code, wf_code)
-        return decisions
+        return dict(zip(workflow_codes, self._iter_decisions(project_code, workflow_codes)))
+
+    def _iter_decisions(
+        self,
+        project_code: int,
+        workflow_codes: List[int]
+    ) -> Iterable[MonitorDecision]:
+        """
+        按 workflow_codes 的顺序逐个产出监控决策
+
+        Args:
+            project_code: 项目编码
+            workflow_codes: 工作流编码列表
+
+        Returns:
+            与 workflow_codes 一一对应的决策
+        """
+        make_decision = self.make_decision
+        if not self.parallel or len(workflow_codes) < 2:
+            return (make_decision(project_code, wf_code) for wf_code in workflow_codes)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=_DECISION_WORKERS,
+                thread_name_prefix="schedule-decision"
+            )
+
+        # map 按提交顺序返回结果，保持与 workflow_codes 相同的顺序
+        return self._executor.map(
+            lambda wf_code: make_decision(project_code, wf_code),
+            workflow_codes
+        )
 
     def get_workflows_to_monitor(
         self,
@@ -451,23 +955,24 @@ class ScheduleTracker:
         Returns:
             (需要监控的工作流编码列表, 所有决策列表)
         """
-        decisions = self.get_all_decisions(project_code, workflow_codes)
+        to_monitor: List[int] = []
+        decisions: List[MonitorDecision] = []
+        to_monitor_append = to_monitor.append
+        decisions_append = decisions.append
 
-        to_monitor = [
-            wf_code for wf_code, decision in decisions.items()
-            if decision.should_query_api
-        ]
+        # 单次遍历同时收集决策和需要监控的工作流，不构建中间字典
+        for wf_code, decision in zip(workflow_codes, self._iter_decisions(project_code, workflow_codes)):
+            decisions_append(decision)
+            if decision.should_query_api:
+                to_monitor_append(wf_code)
 
-        return to_monitor, list(decisions.values())
+        return to_monitor, decisions
 
     def get_stats(self) -> Dict:
         """获取统计信息"""
         with self._lock:
             total = len(self._states)
-            by_status = {}
-            for state in self._states.values():
-                status = state.status
-                by_status[status] = by_status.get(status, 0) + 1
+            by_status = {status: count for status, count in self._status_counts.items() if count}
 
             return {
                 'total_workflows': total,
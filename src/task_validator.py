@@ -44,6 +44,14 @@ class TaskValidationDetail:
 @dataclass
 class WorkflowValidationResult:
     """工作流验证结果"""
+    # 每个失败实例每轮检查都会创建一次，使用 __slots__ 省去实例 __dict__
+    # （所有字段都没有默认值，可以直接与 dataclass 配合使用）
+    __slots__ = (
+        'workflow_instance', 'result', 'message', 'total_tasks', 'failed_tasks',
+        'running_tasks', 'success_tasks', 'tasks_with_retry_remaining',
+        'task_details', 'nested_workflows'
+    )
+
     workflow_instance: WorkflowInstance
     result: ValidationResult
     message: str